@@ -5,13 +5,21 @@ from datetime import datetime, timedelta, timezone
 import asyncio
 import logging
 
-from config import GUILD_ID, BID_FORWARD_CHANNEL_ID, FORUM_IDS, ALLOWED_ROLE_IDS, ACTIVE_TAG_IDS
+from config import (
+    GUILD_ID, BID_FORWARD_CHANNEL_ID, FORUM_IDS, ALLOWED_ROLE_IDS, ACTIVE_TAG_IDS, AUCTION_DURATION_HOURS,
+)
 from utils.embed_builder import LilacEmbed
 
 log = logging.getLogger("cog-auction-manager")
 
 ACCEPT_KEYWORDS = {"accept", "accepted", "accepté", "accepter", "ok", "confirm"}
 
+# Active auction threads: ZSET thread_id → deadline (unix time)
+DEADLINES_KEY = "auction:deadlines"
+AUCTION_DURATION = timedelta(hours=AUCTION_DURATION_HOURS)
+# A deadline whose thread could not be resolved is retried after this delay
+UNRESOLVED_RETRY = timedelta(minutes=10)
+
 
 class JumpButton(discord.ui.View):
     def __init__(self, url: str):
@@ -24,17 +32,151 @@ class AuctionManager(commands.Cog):
         self.bot = bot
         self.accepted_threads: set[int] = set()
         self._thread_locks: dict[int, asyncio.Lock] = {}
+        self._indexed = False
+        # In-memory mirror of the ZSET, the only index when Redis is unavailable
+        self._deadlines: dict[int, float] = {}
+        self.scheduler = bot.scheduler
+        self.scheduler.register("auction-end", self._on_deadline)
+
+    @property
+    def redis(self):
+        return getattr(self.bot, "redis", None)
+
+    async def cog_load(self):
+        if not self.redis:
+            return
+        # Re-arm deadlines persisted by a previous run; overdue ones fire as soon
+        # as the bot is ready (see _on_deadline)
+        for thread_id, deadline in await self.redis.zrange(DEADLINES_KEY, 0, -1, withscores=True):
+            self._deadlines[int(thread_id)] = deadline
+            self.scheduler.schedule("auction-end", int(thread_id), deadline)
+
+    def cog_unload(self):
+        self.scheduler.unregister("auction-end")
 
     def _get_lock(self, thread_id: int) -> asyncio.Lock:
         if thread_id not in self._thread_locks:
             self._thread_locks[thread_id] = asyncio.Lock()
         return self._thread_locks[thread_id]
 
+    # ─────────────────────────────────────────────
+    # Deadline index
+    # ─────────────────────────────────────────────
+
+    @staticmethod
+    def is_active_auction(thread: discord.Thread) -> bool:
+        return (
+            thread.parent_id in FORUM_IDS.values()
+            and not thread.locked
+            and thread.created_at is not None
+            and any(t.id in ACTIVE_TAG_IDS for t in thread.applied_tags)
+        )
+
+    async def _track(self, thread: discord.Thread):
+        """Adds the thread to the deadline index if it is a running auction, else drops it."""
+        if not self.is_active_auction(thread):
+            return await self._untrack(thread.id)
+        deadline = (thread.created_at + AUCTION_DURATION).timestamp()
+        self._deadlines[thread.id] = deadline
+        if self.redis:
+            await self.redis.zadd(DEADLINES_KEY, {str(thread.id): deadline})
+        self.scheduler.schedule("auction-end", thread.id, deadline)
+
+    async def _untrack(self, thread_id: int):
+        self.scheduler.cancel("auction-end", thread_id)
+        self._deadlines.pop(thread_id, None)
+        if self.redis:
+            await self.redis.zrem(DEADLINES_KEY, str(thread_id))
+
+    async def _resolve_thread(self, thread_id: int) -> discord.Thread | None:
+        """
+        Returns the thread, or None if it could not be resolved right now.
+        Raises discord.NotFound if the thread no longer exists.
+        """
+        thread = self.bot.get_channel(thread_id)
+        if thread is None:
+            try:
+                thread = await self.bot.fetch_channel(thread_id)
+            except discord.NotFound:
+                raise
+            except discord.HTTPException as e:
+                log.warning("⚠️ Could not fetch auction thread %s: %s", thread_id, e)
+                return None
+        return thread if isinstance(thread, discord.Thread) else None
+
+    async def _lock_expired(self, thread_id: int) -> bool:
+        """Locks the thread if it is still an active auction past its deadline."""
+        try:
+            thread = await self._resolve_thread(thread_id)
+        except discord.NotFound:
+            await self._untrack(thread_id)   # thread deleted
+            return False
+        if thread is None or thread.parent is None:
+            # Tags can't be read without the parent forum; keep the entry and retry
+            retry_at = (datetime.now(timezone.utc) + UNRESOLVED_RETRY).timestamp()
+            self.scheduler.schedule("auction-end", thread_id, retry_at)
+            return False
+        if not self.is_active_auction(thread):
+            await self._untrack(thread_id)   # locked, or its active tag was removed
+            return False
+        deadline = thread.created_at + AUCTION_DURATION
+        if deadline > datetime.now(timezone.utc):
+            await self._track(thread)   # not due yet (e.g. duration changed)
+            return False
+        async with self._get_lock(thread_id):
+            new_tags = [t for t in thread.applied_tags if t.id not in ACTIVE_TAG_IDS]
+            await thread.edit(applied_tags=new_tags, locked=True)
+        await self._untrack(thread_id)
+        log.info("🔒 Locked thread: %s", thread.name)
+        return True
+
+    async def _on_deadline(self, thread_id: int, _payload):
+        # Deadlines re-armed in cog_load can fire before the gateway cache exists
+        await self.bot.wait_until_ready()
+        await self._lock_expired(thread_id)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # One walk at startup to pick up auctions created while offline;
+        # after that the index is maintained from thread events only.
+        if self._indexed:
+            return
+        self._indexed = True
+        guild = self.bot.get_guild(GUILD_ID)
+        if not guild:
+            return
+        for forum_id in FORUM_IDS.values():
+            forum = guild.get_channel(forum_id)
+            if isinstance(forum, discord.ForumChannel):
+                for thread in forum.threads:
+                    if self.is_active_auction(thread):
+                        await self._track(thread)
+
+    @commands.Cog.listener()
+    async def on_thread_create(self, thread: discord.Thread):
+        if thread.parent_id in FORUM_IDS.values():
+            await self._track(thread)
+
+    @commands.Cog.listener()
+    async def on_thread_update(self, before: discord.Thread, after: discord.Thread):
+        if after.parent_id not in FORUM_IDS.values():
+            return
+        if before.applied_tags != after.applied_tags or before.locked != after.locked:
+            await self._track(after)
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent):
+        if payload.parent_id in FORUM_IDS.values():
+            await self._untrack(payload.thread_id)
+
     # ─────────────────────────────────────────────
     # /auction-end
     # ─────────────────────────────────────────────
 
-    @app_commands.command(name="auction-end", description="Lock threads older than 20h with active tag")
+    @app_commands.command(
+        name="auction-end",
+        description=f"Lock threads older than {AUCTION_DURATION_HOURS:g}h with active tag",
+    )
     @app_commands.guilds(discord.Object(id=GUILD_ID))
     async def auction_end(self, interaction: discord.Interaction):
         if not any(role.id in ALLOWED_ROLE_IDS for role in interaction.user.roles):
@@ -45,30 +187,23 @@ class AuctionManager(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)
 
-        guild  = interaction.guild
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=20)
         locked = 0
 
         try:
-            for name, forum_id in FORUM_IDS.items():
-                forum = guild.get_channel(forum_id)
-                if not isinstance(forum, discord.ForumChannel):
-                    continue
-                for thread in forum.threads:
-                    if thread.locked or thread.created_at is None:
-                        continue
-                    if not any(t.id in ACTIVE_TAG_IDS for t in thread.applied_tags):
-                        continue
-                    if thread.created_at < cutoff:
-                        new_tags = [t for t in thread.applied_tags if t.id not in ACTIVE_TAG_IDS]
-                        await thread.edit(applied_tags=new_tags, locked=True)
-                        locked += 1
-                        log.info("🔒 Locked thread: %s", thread.name)
+            # Only threads already past their deadline are touched
+            now = datetime.now(timezone.utc).timestamp()
+            if self.redis:
+                overdue = [int(t) for t in await self.redis.zrangebyscore(DEADLINES_KEY, "-inf", now)]
+            else:
+                overdue = [t for t, deadline in self._deadlines.items() if deadline <= now]
+            for thread_id in overdue:
+                if await self._lock_expired(thread_id):
+                    locked += 1
 
             await interaction.followup.send(
                 embed=LilacEmbed.success(
                     "Auction-end complete",
-                    f"🔒 Locked **{locked}** thread(s) with active tag older than 20h.",
+                    f"🔒 Locked **{locked}** thread(s) with active tag older than {AUCTION_DURATION_HOURS:g}h.",
                 ),
                 ephemeral=True,
             )
@@ -163,6 +298,7 @@ class AuctionManager(commands.Cog):
                 )
                 await message.channel.edit(locked=True)
                 self.accepted_threads.add(message.channel.id)
+                await self._untrack(message.channel.id)
                 log.info("🔒 Auction accepted & locked: %s", message.channel.name)
 
     @commands.Cog.listener()
@@ -5,14 +5,18 @@ from discord.ext import commands
 from discord import app_commands
 
 from config import (
-    GUILD_ID, NOTIFY_CHANNEL_ID, REDIS_URL, REDIS_TTL,
+    GUILD_ID, NOTIFY_CHANNEL_ID, REDIS_URL, AUTOROLE_SCAN_WORKERS,
     LVL10_ROLE_ID, CROSS_TRADE_ACCESS_ID, CROSS_TRADE_BAN_ID, MARKET_BAN_ID,
 )
+from utils.autorole_cache import AutoroleCache, migrate_legacy_autorole
 from utils.embed_builder import LilacEmbed
 import redis.asyncio as redis
 
 log = logging.getLogger("cog-autorole")
 
+MAX_ATTEMPTS = 3         # per role edit, only 429s are retried
+PROGRESS_INTERVAL = 5.0  # seconds between progress message edits
+
 
 class AutoRole(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -20,9 +24,12 @@ class AutoRole(commands.Cog):
         self.scanning = False
         self.changed_members: list[discord.Member] = []
         self.redis = None
+        self.cache: AutoroleCache | None = None
+        self.index = bot.role_index
 
     async def cog_load(self):
         self.redis = redis.from_url(REDIS_URL, decode_responses=True)
+        self.cache = AutoroleCache(self.redis)
 
     async def cog_unload(self):
         if self.redis:
@@ -32,42 +39,57 @@ class AutoRole(commands.Cog):
     # Core logic
     # ─────────────────────────────────────────────
 
-    async def update_cross_trade_access(self, member: discord.Member):
-        guild        = member.guild
-        access_role  = guild.get_role(CROSS_TRADE_ACCESS_ID)
-        lvl10_role   = guild.get_role(LVL10_ROLE_ID)
-        ban_role     = guild.get_role(CROSS_TRADE_BAN_ID)
-        market_ban   = guild.get_role(MARKET_BAN_ID)
+    @staticmethod
+    def should_have_access(member: discord.Member) -> bool:
+        role_ids = {r.id for r in member.roles}
+        return (
+            LVL10_ROLE_ID in role_ids
+            and CROSS_TRADE_BAN_ID not in role_ids
+            and MARKET_BAN_ID not in role_ids
+        )
 
+    async def update_cross_trade_access(self, member: discord.Member):
+        access_role = member.guild.get_role(CROSS_TRADE_ACCESS_ID)
         if not access_role:
             return
 
-        should_have = (
-            lvl10_role in member.roles
-            and ban_role not in member.roles
-            and market_ban not in member.roles
-        )
-
-        key = f"autorole:{guild.id}:{member.id}"
-        cached = await self.redis.get(key)
+        should_have = self.should_have_access(member)
+        cached = (await self.cache.get_many(member.guild.id, [member.id]))[member.id]
         if cached is not None and (cached == "1") == should_have:
             return  # already correct
 
-        try:
-            if should_have and access_role not in member.roles:
-                await member.add_roles(access_role, reason="AutoRole: Lvl10 without ban")
-                log.info("✅ Added Cross Trade Access to %s", member.display_name)
-                self.changed_members.append(member)
-            elif not should_have and access_role in member.roles:
-                await member.remove_roles(access_role, reason="AutoRole: ban detected or not Lvl10")
-                log.info("🚫 Removed Cross Trade Access from %s", member.display_name)
-                self.changed_members.append(member)
-
-            await self.redis.set(key, "1" if should_have else "0", ex=REDIS_TTL)
-            await asyncio.sleep(1.2)  # rate-limit throttle
+        if (access_role in member.roles) != should_have:
+            if not await self.apply_access(member, access_role, should_have):
+                return  # not cached, so the next update retries
+        await self.cache.set_many(member.guild.id, {member.id: should_have})
 
-        except discord.Forbidden:
-            log.error("❌ Missing permissions for %s", member.display_name)
+    async def apply_access(self, member: discord.Member, access_role: discord.Role, grant: bool) -> bool:
+        """
+        Adds or removes the access role. discord.py already waits out each
+        route's bucket from the rate-limit headers; a 429 that still gets
+        through (shared/global limit) is retried after its Retry-After.
+        """
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                if grant:
+                    await member.add_roles(access_role, reason="AutoRole: Lvl10 without ban")
+                    log.info("✅ Added Cross Trade Access to %s", member.display_name)
+                else:
+                    await member.remove_roles(access_role, reason="AutoRole: ban detected or not Lvl10")
+                    log.info("🚫 Removed Cross Trade Access from %s", member.display_name)
+                self.changed_members.append(member)
+                return True
+            except discord.Forbidden:
+                log.error("❌ Missing permissions for %s", member.display_name)
+                return False
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt == MAX_ATTEMPTS - 1:
+                    log.error("❌ Role edit failed for %s: %s", member.display_name, e)
+                    return False
+                retry_after = float(e.response.headers.get("Retry-After", 1))
+                log.warning("⏳ Rate limited on %s, retrying in %.1fs", member.display_name, retry_after)
+                await asyncio.sleep(retry_after)
+        return False
 
     # ─────────────────────────────────────────────
     # Listener
@@ -78,9 +100,6 @@ class AutoRole(commands.Cog):
         if self.scanning or before.roles == after.roles:
             return
         await self.update_cross_trade_access(after)
-        key = f"autorole:{after.guild.id}:{after.id}"
-        has_access = CROSS_TRADE_ACCESS_ID in {r.id for r in after.roles}
-        await self.redis.set(key, "1" if has_access else "0", ex=REDIS_TTL)
 
     # ─────────────────────────────────────────────
     # /check_autorole_all
@@ -100,6 +119,11 @@ class AutoRole(commands.Cog):
                 ),
                 ephemeral=True,
             )
+        if self.scanning:
+            return await interaction.response.send_message(
+                embed=LilacEmbed.warning("Scan in progress", "A global check is already running."),
+                ephemeral=True,
+            )
 
         await interaction.response.send_message(
             embed=LilacEmbed.info(
@@ -109,27 +133,49 @@ class AutoRole(commands.Cog):
             ephemeral=True,
         )
 
-        total = len(guild.members)
-        checked = 0
+        # Desired state comes from the role index: Lvl10 without either ban.
+        # Only members whose access role disagrees with it are queued.
+        total   = len(guild.members)
+        should  = self.index.members(guild, LVL10_ROLE_ID) - self.index.union(
+            guild, (CROSS_TRADE_BAN_ID, MARKET_BAN_ID)
+        )
+        holders = self.index.members(guild, CROSS_TRADE_ACCESS_ID)
+        pending = [
+            (member, member_id in should)
+            for member_id in should ^ holders
+            if (member := guild.get_member(member_id))
+        ]
+        desired = {member.id: member.id in should for member in guild.members}
         self.scanning = True
         self.changed_members = []
 
-        for member in guild.members:
-            await self.update_cross_trade_access(member)
-            checked += 1
-            if checked % 25 == 0 or checked == total:
-                await interaction.channel.send(
-                    embed=LilacEmbed.info(
-                        "Progress",
-                        f"Checked **{checked}/{total}** members…",
-                    )
-                )
+        progress = await interaction.channel.send(
+            embed=LilacEmbed.info(
+                "Progress",
+                f"Checked **{total}** members — **{len(pending)}** need a role change.",
+            )
+        )
+        try:
+            failed = await self._apply_pending(access_role, pending, progress)
+            # Prefetch the bucket hashes in pipelined HMGET batches and only write
+            # back stale entries; members whose edit failed stay uncached
+            cached = await self.cache.get_many(guild.id, desired)
+            await self.cache.set_many(guild.id, {
+                member_id: state
+                for member_id, state in desired.items()
+                if member_id not in failed and cached.get(member_id) != ("1" if state else "0")
+            })
+        finally:
+            self.scanning = False
 
-        self.scanning = False
         await interaction.channel.send(
-            embed=LilacEmbed.success("Global check complete", f"All **{total}** members have been reviewed.")
+            embed=LilacEmbed.success(
+                "Global check complete",
+                f"All **{total}** members have been reviewed, **{len(self.changed_members)}** updated.",
+            )
         )
-        log.info("♻️ Manual global role check completed in %s", guild.name)
+        log.info("♻️ Manual global role check completed in %s (%s/%s changed)",
+                 guild.name, len(self.changed_members), total)
 
         # Notify changed members
         if self.changed_members:
@@ -146,6 +192,72 @@ class AutoRole(commands.Cog):
                     mentions = " ".join(m.mention for m in self.changed_members[i:i + batch_size])
                     await channel.send(mentions)
 
+    # ─────────────────────────────────────────────
+    # /autorole-migrate (admin)
+    # ─────────────────────────────────────────────
+
+    @app_commands.command(
+        name="autorole-migrate",
+        description="Convert legacy per-member autorole keys into bucketed hashes (admin).",
+    )
+    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.checks.has_permissions(administrator=True)
+    async def autorole_migrate(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        migrated = await migrate_legacy_autorole(self.redis)
+        await interaction.followup.send(
+            embed=LilacEmbed.success(
+                "Migration complete",
+                f"🔁 Folded **{migrated}** legacy autorole key(s) into bucket hashes.",
+            ),
+            ephemeral=True,
+        )
+        log.info("🔁 Migrated %s legacy autorole keys", migrated)
+
+    async def _apply_pending(
+        self,
+        access_role: discord.Role,
+        pending: list[tuple[discord.Member, bool]],
+        progress: discord.Message,
+    ) -> set[int]:
+        """
+        Drains the role changes through a bounded pool of workers.
+        Returns the ids of members whose edit failed.
+        """
+        queue: asyncio.Queue[tuple[discord.Member, bool]] = asyncio.Queue()
+        for item in pending:
+            queue.put_nowait(item)
+        done = 0
+        failed: set[int] = set()
+
+        async def worker():
+            nonlocal done
+            while True:
+                try:
+                    member, should_have = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                if not await self.apply_access(member, access_role, should_have):
+                    failed.add(member.id)
+                done += 1
+
+        async def report():
+            while True:
+                await asyncio.sleep(PROGRESS_INTERVAL)
+                try:
+                    await progress.edit(embed=LilacEmbed.info(
+                        "Progress", f"Applied **{done}/{len(pending)}** role changes…",
+                    ))
+                except discord.HTTPException:
+                    pass
+
+        reporter = asyncio.create_task(report())
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(AUTOROLE_SCAN_WORKERS, len(pending)))))
+        finally:
+            reporter.cancel()
+        return failed
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AutoRole(bot))
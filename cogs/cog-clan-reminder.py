@@ -1,10 +1,12 @@
-import logging
 import asyncio
+import logging
 import time
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-from config import GUILD_ID, COOLDOWN_SECONDS, REMINDER_CLEANUP_MINUTES
+from config import GUILD_ID, COOLDOWN_SECONDS
+from utils.mazoku_events import ClanCast
+from utils.reminder_store import ReminderStore
 
 log = logging.getLogger("cog-clan-reminder")
 
@@ -12,11 +14,23 @@ log = logging.getLogger("cog-clan-reminder")
 class ClanReminder(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.active_reminders: dict[int, asyncio.Task] = {}
-        self.cleanup_task.start()
+        self.settings = bot.settings_cache
+        self.store = ReminderStore(bot, "clan")
+        self.scheduler = bot.scheduler
+        self.scheduler.register("clan", self._fire)
+        self.router = bot.mazoku_router
+        self.router.subscribe(ClanCast, self.on_clan_cast)
+        self._restore: asyncio.Task | None = None
+
+    async def cog_load(self):
+        # Guild, members and channels only exist once the gateway is ready
+        self._restore = asyncio.create_task(self.restore_reminders())
 
     def cog_unload(self):
-        self.cleanup_task.cancel()
+        if self._restore:
+            self._restore.cancel()
+        self.scheduler.unregister("clan")
+        self.router.unsubscribe(ClanCast, self.on_clan_cast)
 
     # ─────────────────────────────────────────────
     # Send helper
@@ -38,12 +52,7 @@ class ClanReminder(commands.Cog):
     # ─────────────────────────────────────────────
 
     async def is_reminder_enabled(self, member: discord.Member) -> bool:
-        if not getattr(self.bot, "redis", None):
-            return True
-        val = await self.bot.redis.get(
-            f"reminder:settings:{member.guild.id}:{member.id}:clan"
-        )
-        return val != "0"
+        return await self.settings.get(member.guild.id, member.id, "clan") != "0"
 
     # ─────────────────────────────────────────────
     # Start / restore reminders
@@ -52,109 +61,51 @@ class ClanReminder(commands.Cog):
     async def start_reminder(self, member: discord.Member, channel: discord.TextChannel):
         if not await self.is_reminder_enabled(member):
             return
-        user_id   = member.id
-        redis_key = f"reminder:clan:{user_id}"
-
-        if user_id in self.active_reminders:
+        if self.scheduler.is_scheduled("clan", member.id):
             return
 
-        if getattr(self.bot, "redis", None):
-            await self.bot.redis.hset(
-                redis_key,
-                mapping={"expire_at": int(time.time()) + COOLDOWN_SECONDS, "channel_id": channel.id},
-            )
+        expire_at = int(time.time()) + COOLDOWN_SECONDS
+        await self.store.add(member.id, expire_at, channel.id)
 
-        async def _task():
-            try:
-                await asyncio.sleep(COOLDOWN_SECONDS)
-                if await self.is_reminder_enabled(member):
-                    await self.send_reminder_message(member, channel)
-            finally:
-                self.active_reminders.pop(user_id, None)
-                if getattr(self.bot, "redis", None):
-                    await self.bot.redis.delete(redis_key)
-
-        self.active_reminders[user_id] = asyncio.create_task(_task())
+        self.scheduler.schedule("clan", member.id, expire_at, channel)
         log.info("▶️ Clan reminder started for %s (%ss)", member.display_name, COOLDOWN_SECONDS)
 
+    async def _fire(self, user_id: int, channel: discord.TextChannel):
+        """Scheduler callback — sends the clan reminder once it is due."""
+        try:
+            member = channel.guild.get_member(user_id)
+            if member and await self.is_reminder_enabled(member):
+                await self.send_reminder_message(member, channel)
+        finally:
+            await self.store.remove(user_id)
+
     async def restore_reminders(self):
-        if not getattr(self.bot, "redis", None):
-            return
+        await self.bot.wait_until_ready()
         guild = self.bot.get_guild(GUILD_ID)
         if not guild:
+            log.warning("⚠️ Guild %s not found, clan reminders not restored", GUILD_ID)
             return
 
-        now  = int(time.time())
-        keys = await self.bot.redis.keys("reminder:clan:*")
-
-        for redis_key in keys:
-            try:
-                user_id = int(redis_key.split(":")[-1])
-            except ValueError:
-                continue
-
-            data = await self.bot.redis.hgetall(redis_key)
-            if not data:
-                continue
-
-            remaining = int(data.get("expire_at", 0)) - now
-            if remaining <= 0:
-                await self.bot.redis.delete(redis_key)
-                continue
-
+        for user_id, expire_at, channel_id in await self.store.load_pending():
             member  = guild.get_member(user_id)
-            channel = guild.get_channel(int(data.get("channel_id", 0)))
+            channel = guild.get_channel(channel_id)
             if not member or not channel:
+                await self.store.remove(user_id)   # would never fire
                 continue
 
-            async def _task(member=member, channel=channel, remaining=remaining, key=redis_key, uid=user_id):
-                try:
-                    await asyncio.sleep(remaining)
-                    if await self.is_reminder_enabled(member):
-                        await self.send_reminder_message(member, channel)
-                finally:
-                    self.active_reminders.pop(uid, None)
-                    await self.bot.redis.delete(key)
-
-            self.active_reminders[user_id] = asyncio.create_task(_task())
-            log.info("♻️ Restored clan reminder for %s (%ss left)", member.display_name, remaining)
-
-    # ─────────────────────────────────────────────
-    # Cleanup task
-    # ─────────────────────────────────────────────
-
-    @tasks.loop(minutes=REMINDER_CLEANUP_MINUTES)
-    async def cleanup_task(self):
-        if not getattr(self.bot, "redis", None):
-            return
-        now = int(time.time())
-        for redis_key in await self.bot.redis.keys("reminder:clan:*"):
-            data      = await self.bot.redis.hgetall(redis_key)
-            expire_at = int(data.get("expire_at", 0)) if data else 0
-            if expire_at and expire_at <= now:
-                await self.bot.redis.delete(redis_key)
-
-    @cleanup_task.before_loop
-    async def before_cleanup(self):
-        await self.bot.wait_until_ready()
+            self.scheduler.schedule("clan", user_id, expire_at, channel)
+            log.info(
+                "♻️ Restored clan reminder for %s (%ss left)",
+                member.display_name, expire_at - int(time.time()),
+            )
 
     # ─────────────────────────────────────────────
-    # Listener
+    # Mazoku events
     # ─────────────────────────────────────────────
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if not after.guild or not after.embeds:
-            return
-
-        embed  = after.embeds[0]
-        title  = (embed.title or "").lower()
-        footer = after.embeds[0].footer.text if after.embeds[0].footer else ""
-
-        if "casting for round" not in title or not footer:
-            return
-
-        guild  = after.guild
+    async def on_clan_cast(self, event: ClanCast):
+        guild  = event.message.guild
+        footer = event.caster
         member = guild.get_member_named(footer) or discord.utils.find(
             lambda m: m.display_name.lower() == footer.lower(), guild.members
         )
@@ -163,11 +114,9 @@ class ClanReminder(commands.Cog):
             log.warning("❌ ClanReminder: could not find member '%s'", footer)
             return
 
-        await self.start_reminder(member, after.channel)
+        await self.start_reminder(member, event.message.channel)
 
 
 async def setup(bot: commands.Bot):
-    cog = ClanReminder(bot)
-    await bot.add_cog(cog)
-    await cog.restore_reminders()
+    await bot.add_cog(ClanReminder(bot))
     log.info("⚙️ ClanReminder cog loaded")
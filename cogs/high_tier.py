@@ -1,4 +1,3 @@
-import re
 import time
 import logging
 import discord
@@ -6,10 +5,10 @@ from discord import app_commands
 from discord.ext import commands, tasks
 
 from config import (
-    GUILD_ID, HIGH_TIER_ROLE_ID, HIGH_TIER_COOLDOWN, REQUIRED_ROLE_ID,
-    RARITY_EMOJIS, RARITY_CUSTOM_EMOJIS, RARITY_PRIORITY,
+    GUILD_ID, HIGH_TIER_ROLE_ID, HIGH_TIER_COOLDOWN, REQUIRED_ROLE_ID, RARITY_CUSTOM_EMOJIS,
 )
 from utils.embed_builder import LilacEmbed
+from utils.mazoku_events import AutoSummon
 
 log = logging.getLogger("cog-high-tier")
 
@@ -25,9 +24,12 @@ class HighTier(commands.Cog):
         self.bot = bot
         self.triggered_messages: dict[int, float] = {}
         self.cleanup_triggered.start()
+        self.router = bot.mazoku_router
+        self.router.subscribe(AutoSummon, self.on_auto_summon)
 
     def cog_unload(self):
         self.cleanup_triggered.cancel()
+        self.router.unsubscribe(AutoSummon, self.on_auto_summon)
 
     # ─────────────────────────────────────────────
     # Cooldown helper
@@ -158,43 +160,22 @@ class HighTier(commands.Cog):
         await self.bot.wait_until_ready()
 
     # ─────────────────────────────────────────────
-    # Listener — rare spawn ping
+    # Mazoku event — rare spawn ping
     # ─────────────────────────────────────────────
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if not after.guild or not after.embeds:
-            return
-        if after.id in self.triggered_messages:
-            return
-
-        embed = after.embeds[0]
-        title = (embed.title or "").lower()
-        desc  = embed.description or ""
-
-        if "auto summon" not in title:
-            return
-
-        found_rarity   = None
-        highest_prio   = 0
-        for emoji_id, rarity in RARITY_EMOJIS.items():
-            # Match full Discord emoji format: <:name:ID> or <a:name:ID>
-            pattern = rf"<a?:[^:]+:{re.escape(emoji_id)}>"
-            if re.search(pattern, desc) and RARITY_PRIORITY[rarity] > highest_prio:
-                found_rarity = rarity
-                highest_prio = RARITY_PRIORITY[rarity]
-
-        if not found_rarity:
+    async def on_auto_summon(self, event: AutoSummon):
+        message = event.message
+        if message.id in self.triggered_messages:
             return
 
-        role = after.guild.get_role(HIGH_TIER_ROLE_ID)
+        role = message.guild.get_role(HIGH_TIER_ROLE_ID)
         if not role:
             return
 
-        self.triggered_messages[after.id] = time.time()
-        custom_emoji = RARITY_CUSTOM_EMOJIS.get(found_rarity, "🌸")
-        msg = RARITY_MESSAGES[found_rarity].format(emoji=custom_emoji)
-        await after.channel.send(f"{msg}\n🔥 {role.mention}")
+        self.triggered_messages[message.id] = time.time()
+        custom_emoji = RARITY_CUSTOM_EMOJIS.get(event.rarity, "🌸")
+        msg = RARITY_MESSAGES[event.rarity].format(emoji=custom_emoji)
+        await message.channel.send(f"{msg}\n🔥 {role.mention}")
 
 
 async def setup(bot: commands.Bot):
@@ -1,16 +1,24 @@
+import json
 import logging
-import re
 import discord
 from discord import app_commands
 from discord.ext import commands
+from datetime import datetime, timedelta
 
-from config import GUILD_ID, MAZOKU_BOT_ID, Colors
+from config import GUILD_ID, Colors
 from utils.embed_builder import (
     LilacEmbed,
+    build_archive_embed,
     build_leaderboard_embed,
+    build_stats_embed,
     CATEGORY_EMOJIS,
     CATEGORY_LABELS,
 )
+from utils.board_view import BoardPagerView
+from utils.leaderboard_engine import version_key
+from utils.leaderboard_keys import WINDOWS, day_expire_at, day_key, nai_board_key, next_month_at, utc_now
+from utils.mazoku_events import CardClaimed
+from utils.write_buffer import WriteBuffer
 
 log = logging.getLogger("cog-leaderboard")
 
@@ -22,18 +30,186 @@ def is_admin():
 
 
 KEY_MAP = {
+    "all":        "lb:all",
+    "monthly":    "lb:monthly",
+    "autosummon": "lb:autosummon",
+    "summon":     "lb:summon",
+}
+# Pre-ZSET hashes, folded into KEY_MAP on load
+LEGACY_KEY_MAP = {
     "all":        "leaderboard",
     "monthly":    "activity:monthly",
     "autosummon": "activity:autosummon",
     "summon":     "activity:summon",
 }
+MONTHLY_TOTAL_KEY = "activity:monthly:total"
+
+# Claim dedup: one SET of "{message_id}:{user_id}" per UTC day. A claim is new
+# if it is in neither today's nor yesterday's slice, so an edit is recognised
+# for at least 24h while Redis only ever holds two keys for dedup.
+# Legacy per-claim keys (claim:{message_id}:{user_id}) written before the
+# seen-sets are still honoured until they expire.
+DEDUP_PREFIX = "claim:seen"
+DEDUP_RETENTION_DAYS = 1
+LEGACY_CLAIM_PREFIX = "claim"
+
+# Monthly rollover
+MONTHLY_MARKER_KEY  = "lb:monthly:month"      # YYYYMM the live monthly board belongs to
+MONTHLY_CLOSING_KEY = "lb:monthly:closing"    # SET of months renamed but not yet archived
+MONTHLY_ARCHIVE_KEY = "lb:archive:monthly"    # HASH YYYYMM → JSON snapshot
+ARCHIVE_TOP_N = 10
+ROLLOVER_RETRY_SECONDS = 300
+
+
+def closing_key(key: str, month: str) -> str:
+    """Where a live monthly key is moved when its month closes."""
+    return f"{key}:closing:{month}"
+
+
+# Moves the live monthly board and total aside under :closing:{month} once
+# the calendar month changes. Runs atomically with claim recording, and the
+# claim buffer is flushed right before it, so every claim lands in the month
+# it was made in. The caller reads the marker first so the closing keys can be
+# passed in KEYS; the script refuses to run if the marker moved meanwhile.
+# KEYS[1] marker  KEYS[2] monthly board  KEYS[3] monthly total
+# KEYS[4] board's closing key  KEYS[5] total's closing key
+# KEYS[6] board version  KEYS[7] closing set
+# ARGV[1] current YYYYMM  ARGV[2] marker as read by the caller ("" if unset)
+# Returns the closed month, or nil if no rollover was due.
+ROLLOVER_SCRIPT = """
+local previous = redis.call('GET', KEYS[1])
+if (previous or '') ~= ARGV[2] then
+    return redis.error_reply('monthly marker changed')
+end
+redis.call('SET', KEYS[1], ARGV[1])
+if not previous or previous == ARGV[1] then
+    return false
+end
+for i = 2, 3 do
+    if redis.call('EXISTS', KEYS[i]) == 1 then
+        redis.call('RENAME', KEYS[i], KEYS[i + 2])
+    end
+end
+redis.call('INCR', KEYS[6])
+redis.call('SADD', KEYS[7], previous)
+return previous
+"""
+
+# Records a batch of buffered claims atomically. Each claim is deduped against
+# the daily seen-sets and any legacy claim:{claim_id} key; increments of the
+# new ones are summed per (key, user) so Redis sees one ZINCRBY per distinct
+# user rather than one per claim. Every touched board gets its version
+# counter ({key}:v) bumped for the render cache.
+# Rolling windows are rebuilt from their buckets first if this is the first
+# write of a new period, then incremented like any other board.
+# Every key is passed in KEYS; the JSON payloads only hold indexes into it.
+# A board is referenced as [board, version] so its counter can be bumped.
+# KEYS[1]  today's seen-set    KEYS[2] yesterday's seen-set    KEYS[3..] everything else
+# ARGV[1]  JSON [[claim_id, user_id, legacy key, [boards], [plain counters]], ...]
+# ARGV[2]  JSON [[window board, window_expire_at, [bucket keys], current bucket board, bucket_expire_at], ...]
+# ARGV[3]  today's seen-set EXPIREAT
+# Returns the number of claims that were not duplicates.
+CLAIM_SCRIPT = """
+local claims  = cjson.decode(ARGV[1])
+local windows = cjson.decode(ARGV[2])
+for _, w in ipairs(windows) do
+    if redis.call('EXISTS', KEYS[w[1][1]]) == 0 then
+        local buckets = {}
+        for i, b in ipairs(w[3]) do
+            buckets[i] = KEYS[b]
+        end
+        redis.call('ZUNIONSTORE', KEYS[w[1][1]], #buckets, unpack(buckets))
+        redis.call('INCR', KEYS[w[1][2]])
+    end
+end
+local zsets, versions, counters, recorded = {}, {}, {}, 0
+for _, claim in ipairs(claims) do
+    if redis.call('SISMEMBER', KEYS[2], claim[1]) == 0
+            and redis.call('EXISTS', KEYS[claim[3]]) == 0
+            and redis.call('SADD', KEYS[1], claim[1]) == 1 then
+        recorded = recorded + 1
+        for _, board in ipairs(claim[4]) do
+            zsets[board[1]] = zsets[board[1]] or {}
+            zsets[board[1]][claim[2]] = (zsets[board[1]][claim[2]] or 0) + 1
+            versions[board[1]] = board[2]
+        end
+        for _, key in ipairs(claim[5]) do
+            counters[key] = (counters[key] or 0) + 1
+        end
+    end
+end
+for key, users in pairs(zsets) do
+    for user, amount in pairs(users) do
+        redis.call('ZINCRBY', KEYS[key], amount, user)
+    end
+    redis.call('INCR', KEYS[versions[key]])
+end
+for key, amount in pairs(counters) do
+    redis.call('INCRBY', KEYS[key], amount)
+end
+for _, w in ipairs(windows) do
+    redis.call('EXPIREAT', KEYS[w[1][1]], w[2])
+    redis.call('EXPIREAT', KEYS[w[1][2]], w[2])
+    redis.call('EXPIREAT', KEYS[w[4][1]], w[5])
+    redis.call('EXPIREAT', KEYS[w[4][2]], w[5])
+end
+redis.call('EXPIREAT', KEYS[1], ARGV[3])
+return recorded
+"""
+
+
+class ArchiveSelect(discord.ui.Select):
+    def __init__(self, months: list[str]):
+        super().__init__(
+            placeholder="🗄️  Browse past months…",
+            options=[
+                discord.SelectOption(label=datetime.strptime(m, "%Y%m").strftime("%B %Y"), value=m)
+                for m in months
+            ],
+            row=2,
+        )
+
+    async def callback(self, interaction: discord.Interaction):
+        await self.view.show_archive(interaction, self.values[0])
+
+
+class LeaderboardView(BoardPagerView):
+    def __init__(self, bot: commands.Bot, guild: discord.Guild, archive_months: list[str] = ()):
+        super().__init__(bot, guild, "all")
+        if archive_months:
+            self.add_item(ArchiveSelect(archive_months))
+
+    async def show_archive(self, interaction: discord.Interaction, month: str):
+        raw = await self.bot.redis.hget(MONTHLY_ARCHIVE_KEY, month)
+        if raw is None:
+            return await interaction.response.send_message(
+                embed=LilacEmbed.warning("Archive missing", "That month is no longer archived."),
+                ephemeral=True,
+            )
+        for button in (self.prev_page, self.next_page, self.jump_to_me):
+            button.disabled = True
+        embed = build_archive_embed(month, json.loads(raw), interaction.guild, interaction.user)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def _build(self, category, guild, user, start=0):
+        self.jump_to_me.disabled = False
+        return await super()._build(category, guild, user, start)
+
+    def board_key(self, category: str) -> str:
+        if category in WINDOWS:
+            return WINDOWS[category].window_key(utc_now())
+        return KEY_MAP[category]
 
+    async def prepare(self, category: str):
+        window = WINDOWS.get(category)
+        if window:
+            now = utc_now()
+            await self.engine.ensure_union(
+                window.window_key(now), window.bucket_keys(now), window.window_expire_at(now)
+            )
 
-class LeaderboardView(discord.ui.View):
-    def __init__(self, bot: commands.Bot, guild: discord.Guild):
-        super().__init__(timeout=120)
-        self.bot   = bot
-        self.guild = guild
+    def build_embed(self, category, board, guild, user):
+        return build_leaderboard_embed(category, board, guild, user)
 
     @discord.ui.select(
         placeholder="📊  Choose a category…",
@@ -43,45 +219,112 @@ class LeaderboardView(discord.ui.View):
                 value=k,
                 emoji=CATEGORY_EMOJIS[k],
             )
-            for k in ("all", "monthly", "autosummon", "summon")
+            for k in ("all", "monthly", "24h", "7d", "autosummon", "summon")
         ],
+        row=0,
     )
     async def select_callback(
         self, interaction: discord.Interaction, select: discord.ui.Select
     ):
-        category = select.values[0]
-        embed = await self._build(category, interaction.guild, interaction.user)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    async def _build(self, category, guild, user):
-        if not getattr(self.bot, "redis", None):
-            return LilacEmbed.error("Redis unavailable", "The database is not connected.")
-        data = await self.bot.redis.hgetall(KEY_MAP[category])
-        if not data:
-            embed = LilacEmbed(
-                title=f"{CATEGORY_EMOJIS[category]}  {CATEGORY_LABELS[category]} Leaderboard",
-                description="*No data yet — start claiming!*",
-                color=Colors.GOLD,
-            )
-            embed.set_guild_thumbnail(guild)
-            embed.set_requester_footer(user)
-            return embed
-        sorted_data = sorted(data.items(), key=lambda x: int(x[1]), reverse=True)
-        return build_leaderboard_embed(category, sorted_data, guild, user)
+        await self._show(interaction, select.values[0], 0)
 
 
 class Leaderboard(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.paused = {k: False for k in KEY_MAP}
+        self.paused = {k: False for k in (*KEY_MAP, *WINDOWS)}
+        self.engine = bot.leaderboard_engine
+        self._claim_script = None
+        self._rollover_script = None
+        # Pending claims keyed by dedup key; a repeated edit keeps the first entry
+        self.buffer = WriteBuffer(self._flush_claims, name="claims", merge=lambda old, new: old)
+        self.router = bot.mazoku_router
+        self.router.subscribe(CardClaimed, self.on_card_claimed)
+        self.scheduler = bot.scheduler
+        self.scheduler.register("lb-rollover", self._on_rollover_due)
         log.info("⚙️ Leaderboard cog loaded (GUILD_ID=%s)", GUILD_ID)
 
+    async def cog_load(self):
+        if not getattr(self.bot, "redis", None):
+            return
+        self._claim_script = self.bot.redis.register_script(CLAIM_SCRIPT)
+        self._rollover_script = self.bot.redis.register_script(ROLLOVER_SCRIPT)
+        for category, legacy_key in LEGACY_KEY_MAP.items():
+            await self.engine.migrate_board(legacy_key, KEY_MAP[category])
+        await self._on_rollover_due(0, None)
+
+    async def cog_unload(self):
+        self.router.unsubscribe(CardClaimed, self.on_card_claimed)
+        self.scheduler.unregister("lb-rollover")
+        await self.buffer.close()
+
+    # ─────────────────────────────────────────────
+    # Monthly rollover
+    # ─────────────────────────────────────────────
+
+    async def _on_rollover_due(self, _entry_id: int, _payload):
+        now = utc_now()
+        due_at = next_month_at(now) + 1
+        try:
+            # Claims still buffered from before the boundary belong to the closing month
+            await self.buffer.flush()
+            previous = await self.bot.redis.get(MONTHLY_MARKER_KEY)
+            closing  = previous or f"{now:%Y%m}"   # unused unless a month closes
+            closed = await self._rollover_script(
+                keys=[
+                    MONTHLY_MARKER_KEY, KEY_MAP["monthly"], MONTHLY_TOTAL_KEY,
+                    closing_key(KEY_MAP["monthly"], closing), closing_key(MONTHLY_TOTAL_KEY, closing),
+                    version_key(KEY_MAP["monthly"]), MONTHLY_CLOSING_KEY,
+                ],
+                args=[f"{now:%Y%m}", previous or ""],
+            )
+            if closed:
+                log.info("📆 Monthly leaderboard for %s closed", closed)
+            await self._archive_closed_months()
+        except Exception:
+            # The marker only moves inside the script, so a retry picks up where this stopped
+            log.exception("❌ Monthly rollover failed, retrying in %ss", ROLLOVER_RETRY_SECONDS)
+            due_at = now.timestamp() + ROLLOVER_RETRY_SECONDS
+        finally:
+            self.scheduler.schedule("lb-rollover", 0, due_at)
+
+    async def _archive_closed_months(self):
+        """Snapshots every closed month (top N + totals) and drops its full board."""
+        for month in await self.bot.redis.smembers(MONTHLY_CLOSING_KEY):
+            board = closing_key(KEY_MAP["monthly"], month)
+            total = closing_key(MONTHLY_TOTAL_KEY, month)
+
+            pipe = self.bot.redis.pipeline(transaction=False)
+            pipe.zrevrange(board, 0, ARCHIVE_TOP_N - 1, withscores=True)
+            pipe.zcard(board)
+            pipe.get(total)
+            top, players, claims = await pipe.execute()
+
+            snapshot = {
+                "top":     [[uid, int(score)] for uid, score in top],
+                "players": players,
+                "claims":  int(claims or 0),
+            }
+            pipe = self.bot.redis.pipeline(transaction=True)
+            pipe.hset(MONTHLY_ARCHIVE_KEY, month, json.dumps(snapshot))
+            pipe.delete(board, total)
+            pipe.srem(MONTHLY_CLOSING_KEY, month)
+            await pipe.execute()
+            log.info("🗄️ Archived %s: %s players, %s claims", month, players, snapshot["claims"])
+
+    # ─────────────────────────────────────────────
+    # Commands
+    # ─────────────────────────────────────────────
+
     @app_commands.command(name="leaderboard", description="View the leaderboard")
     @app_commands.guilds(discord.Object(id=GUILD_ID))
     @app_commands.checks.cooldown(1, 120.0, key=lambda i: i.user.id)
     async def leaderboard(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=False)
-        view  = LeaderboardView(self.bot, interaction.guild)
+        months = []
+        if getattr(self.bot, "redis", None):
+            months = sorted(await self.bot.redis.hkeys(MONTHLY_ARCHIVE_KEY), reverse=True)[:25]
+        view  = LeaderboardView(self.bot, interaction.guild, months)
         embed = await view._build("all", interaction.guild, interaction.user)
         await interaction.followup.send(embed=embed, view=view)
 
@@ -96,6 +339,23 @@ class Leaderboard(commands.Cog):
                 ephemeral=True,
             )
 
+    @app_commands.command(name="mystats", description="Your rank and score on every leaderboard")
+    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    async def mystats(self, interaction: discord.Interaction):
+        if not getattr(self.bot, "redis", None):
+            return await interaction.response.send_message(embed=LilacEmbed.error("Redis unavailable"), ephemeral=True)
+        boards = [
+            (CATEGORY_EMOJIS[k], CATEGORY_LABELS[k], KEY_MAP[k], "claims")
+            for k in ("all", "monthly", "autosummon", "summon")
+        ] + [
+            ("☀️", "NAI Daily",    nai_board_key("daily"),   "points"),
+            ("📅", "NAI Monthly",  nai_board_key("monthly"), "points"),
+            ("🏆", "NAI All Time", nai_board_key("all"),     "points"),
+        ]
+        stats = await self.engine.stats([key for _, _, key, _ in boards], interaction.user.id)
+        rows  = [(emoji, label, rank, score, unit) for (emoji, label, _, unit), (rank, score) in zip(boards, stats)]
+        await interaction.response.send_message(embed=build_stats_embed(interaction.user, rows), ephemeral=True)
+
     @app_commands.command(name="leaderboard-reset", description="Reset scores (admin)")
     @app_commands.choices(
         category=[
@@ -113,11 +373,10 @@ class Leaderboard(commands.Cog):
         if not getattr(self.bot, "redis", None):
             return await interaction.followup.send(embed=LilacEmbed.error("Redis unavailable"), ephemeral=True)
         if category.value == "all_keys":
-            for key in KEY_MAP.values():
-                await self.bot.redis.delete(key)
+            await self.engine.reset(*KEY_MAP.values())
             msg = "All leaderboard scores have been wiped."
         else:
-            await self.bot.redis.delete(KEY_MAP[category.value])
+            await self.engine.reset(KEY_MAP[category.value])
             msg = f"Category **{CATEGORY_LABELS[category.value]}** has been reset."
         await interaction.followup.send(embed=LilacEmbed.success("Reset complete", f"🧹 {msg}"), ephemeral=True)
 
@@ -131,6 +390,8 @@ class Leaderboard(commands.Cog):
             app_commands.Choice(name="Monthly",    value="monthly"),
             app_commands.Choice(name="AutoSummon", value="autosummon"),
             app_commands.Choice(name="Summon",     value="summon"),
+            app_commands.Choice(name="Last 24h",   value="24h"),
+            app_commands.Choice(name="Last 7 days", value="7d"),
         ],
         state=[
             app_commands.Choice(name="Pause",  value="pause"),
@@ -164,18 +425,65 @@ class Leaderboard(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         if not getattr(self.bot, "redis", None):
             return await interaction.followup.send(embed=LilacEmbed.error("Redis unavailable"), ephemeral=True)
-        total_monthly = await self.bot.redis.get("activity:monthly:total") or 0
+        total_monthly = await self.bot.redis.get(MONTHLY_TOTAL_KEY) or 0
         embed = LilacEmbed(title="🛠️  Leaderboard Debug", color=Colors.INFO)
         for k, redis_key in KEY_MAP.items():
-            size = await self.bot.redis.hlen(redis_key)
+            size = await self.engine.size(redis_key)
+            paused_label = " *(paused)*" if self.paused[k] else ""
+            embed.add_field(
+                name=f"{CATEGORY_EMOJIS[k]} {CATEGORY_LABELS[k]}{paused_label}",
+                value=f"**{size}** entries", inline=True,
+            )
+        now = utc_now()
+        for k, window in WINDOWS.items():
+            size = await self.engine.size(window.window_key(now))
             paused_label = " *(paused)*" if self.paused[k] else ""
             embed.add_field(
                 name=f"{CATEGORY_EMOJIS[k]} {CATEGORY_LABELS[k]}{paused_label}",
                 value=f"**{size}** entries", inline=True,
             )
         embed.add_field(name="📅 Monthly total claims", value=f"**{total_monthly}**", inline=False)
+        embed.add_field(
+            name="🧮 Claim dedup memory",
+            value=await self._dedup_stats(scan_legacy=scope.value == "full"),
+            inline=False,
+        )
         await interaction.followup.send(embed=embed, ephemeral=True)
 
+    async def _dedup_stats(self, scan_legacy: bool) -> str:
+        """Memory held by the daily seen-sets, and by leftover per-claim keys when asked."""
+        now    = utc_now()
+        slices = [day_key(DEDUP_PREFIX, now), day_key(DEDUP_PREFIX, now - timedelta(days=1))]
+        pipe   = self.bot.redis.pipeline(transaction=False)
+        for key in slices:
+            pipe.scard(key)
+            pipe.memory_usage(key)
+        results = await pipe.execute()
+        entries = sum(results[0::2])
+        used    = sum(m or 0 for m in results[1::2])
+        text    = f"Seen-sets: **{entries}** claims in {len(slices)} keys · **{used / 1024:.1f} KiB**"
+        if not scan_legacy:
+            return text
+
+        # Keys written by the old SET NX scheme; they expire within 24h of the switch
+        legacy_keys, legacy_used = 0, 0
+        batch: list[str] = []
+        async for key in self.bot.redis.scan_iter(match="claim:[0-9]*", count=1000):
+            batch.append(key)
+            if len(batch) >= 500:
+                legacy_keys, legacy_used = legacy_keys + len(batch), legacy_used + await self._memory_of(batch)
+                batch.clear()
+        legacy_keys, legacy_used = legacy_keys + len(batch), legacy_used + await self._memory_of(batch)
+        return f"{text}\nLegacy per-claim keys: **{legacy_keys}** · **{legacy_used / 1024:.1f} KiB**"
+
+    async def _memory_of(self, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        pipe = self.bot.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.memory_usage(key)
+        return sum(m or 0 for m in await pipe.execute())
+
     @leaderboard_debug.error
     async def _debug_error(self, i, e): await self._admin_error(i, e, "debug")
 
@@ -194,39 +502,64 @@ class Leaderboard(commands.Cog):
         except discord.InteractionResponded:
             await interaction.followup.send(embed=LilacEmbed.error(f"Error during {action}"), ephemeral=True)
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if after.author.id != MAZOKU_BOT_ID:
+    async def on_card_claimed(self, event: CardClaimed):
+        message = event.message
+        if message.guild.id != GUILD_ID:
             return
-        if not after.guild or after.guild.id != GUILD_ID or not after.embeds:
+        user_id = event.user_id
+        member  = message.guild.get_member(user_id)
+        if not member or not self._claim_script:
             return
-        embed = after.embeds[0]
-        title = (embed.title or "").lower()
-        if not any(x in title for x in ["card claimed", "auto summon claimed", "summon claimed"]):
-            return
-        match = re.search(r"<@!?(\d+)>", embed.description or "")
-        if not match:
-            return
-        user_id = int(match.group(1))
-        member  = after.guild.get_member(user_id)
-        if not member or not getattr(self.bot, "redis", None):
-            return
-        claim_key = f"claim:{after.id}:{user_id}"
-        if await self.bot.redis.get(claim_key):
+
+        categories = ["monthly", "autosummon" if event.auto else "summon", "all"]
+        zsets      = tuple(KEY_MAP[c] for c in categories if not self.paused[c])
+        counters   = () if self.paused["monthly"] else (MONTHLY_TOTAL_KEY,)
+        windows    = tuple(w for w in WINDOWS if not self.paused[w])
+
+        self.buffer.add(f"{message.id}:{user_id}", (str(user_id), zsets, counters, windows))
+        log.debug("🏅 %s claim queued (%s)", member.display_name, message.embeds[0].title)
+
+    async def _flush_claims(self, batch: dict[str, tuple[str, tuple, tuple, tuple]]):
+        if not self._claim_script:
             return
-        await self.bot.redis.set(claim_key, "1", ex=86400)
-        if not self.paused["monthly"]:
-            await self.bot.redis.hincrby("activity:monthly", str(user_id), 1)
-            await self.bot.redis.incr("activity:monthly:total")
-        if "auto summon claimed" in title:
-            if not self.paused["autosummon"]:
-                await self.bot.redis.hincrby("activity:autosummon", str(user_id), 1)
-        else:
-            if not self.paused["summon"]:
-                await self.bot.redis.hincrby("activity:summon", str(user_id), 1)
-        if not self.paused["all"]:
-            await self.bot.redis.hincrby("leaderboard", str(user_id), 1)
-        log.info("🏅 %s +1 point (%s)", member.display_name, embed.title)
+        # Window keys are resolved at flush time so a batch never straddles periods
+        now  = utc_now()
+        keys: dict[str, int] = {}   # key → 1-based index into KEYS
+
+        def ref(key: str) -> int:
+            return keys.setdefault(key, len(keys) + 1)
+
+        def board(key: str) -> list[int]:
+            return [ref(key), ref(version_key(key))]
+
+        ref(day_key(DEDUP_PREFIX, now))
+        ref(day_key(DEDUP_PREFIX, now - timedelta(days=1)))
+        used    = {w for (_, _, _, active) in batch.values() for w in active}
+        windows = {
+            name: [
+                board(w.window_key(now)), w.window_expire_at(now),
+                [ref(k) for k in w.bucket_keys(now)],
+                board(w.bucket_key(now)), w.bucket_expire_at(now),
+            ]
+            for name, w in WINDOWS.items() if name in used
+        }
+        claims = [
+            [
+                claim_id, user_id, ref(f"{LEGACY_CLAIM_PREFIX}:{claim_id}"),
+                [*map(board, zsets), *(windows[w][i] for w in active for i in (0, 3))],
+                [ref(k) for k in counters],
+            ]
+            for claim_id, (user_id, zsets, counters, active) in batch.items()
+        ]
+        recorded = await self._claim_script(
+            keys=list(keys),
+            args=[
+                json.dumps(claims),
+                json.dumps(list(windows.values())),
+                day_expire_at(now, DEDUP_RETENTION_DAYS),
+            ],
+        )
+        log.info("🏅 Recorded %s new claim(s) out of %s buffered", recorded, len(claims))
 
 
 async def setup(bot: commands.Bot):
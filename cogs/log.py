@@ -3,6 +3,7 @@ import discord
 from discord.ext import commands
 
 from config import GUILD_ID, MAZOKU_BOT_ID
+from utils.mazoku_events import MazokuEdit
 
 log = logging.getLogger("cog-log")
 
@@ -10,8 +11,13 @@ log = logging.getLogger("cog-log")
 class MazokuLog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.router = bot.mazoku_router
+        self.router.subscribe(MazokuEdit, self.on_mazoku_edit)
         log.info("⚙️ MazokuLog loaded (GUILD_ID=%s, MAZOKU_BOT_ID=%s)", GUILD_ID, MAZOKU_BOT_ID)
 
+    def cog_unload(self):
+        self.router.unsubscribe(MazokuEdit, self.on_mazoku_edit)
+
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         if message.author.id != MAZOKU_BOT_ID:
@@ -23,15 +29,12 @@ class MazokuLog(commands.Cog):
             log.info("  Embed %s | title=%s | desc=%s | footer=%s",
                      i, e.title, e.description, e.footer.text if e.footer else "")
 
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if after.author.id != MAZOKU_BOT_ID:
-            return
-        if not after.guild or after.guild.id != GUILD_ID or not after.embeds:
+    async def on_mazoku_edit(self, event: MazokuEdit):
+        if event.message.guild.id != GUILD_ID:
             return
-        e = after.embeds[0]
+        e = event.embed
         log.info("✏️ Mazoku edit (ID=%s) | title=%s | desc=%s | footer=%s",
-                 after.id, e.title, e.description, e.footer.text if e.footer else "")
+                 event.message.id, e.title, e.description, e.footer.text if e.footer else "")
 
 
 async def setup(bot: commands.Bot):
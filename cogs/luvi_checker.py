@@ -1,9 +1,13 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
 
-from config import REQUIRED_ROLES_FOR_T3, ROLE_TIER_3, LOG_CHANNEL_ID
+from config import (
+    REQUIRED_ROLES_FOR_T3, ROLE_TIER_3, LOG_CHANNEL_ID,
+    LUVI_AUTO_ENFORCE, LUVI_REMOVAL_INTERVAL, LUVI_LOG_INTERVAL,
+)
 from utils.embed_builder import LilacEmbed
+from utils.rate_queue import RateLimitedQueue
 
 import logging
 log = logging.getLogger("cog-luvi-checker")
@@ -12,6 +16,55 @@ log = logging.getLogger("cog-luvi-checker")
 class LuviChecker(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.index = bot.role_index
+        # member id → guild; repeated updates for one member collapse to one removal
+        self.removals = RateLimitedQueue(self._remove_t3, name="luvi", interval=LUVI_REMOVAL_INTERVAL)
+        self.removed: list[discord.Member] = []   # awaiting the next log batch
+        self.flush_log.change_interval(seconds=LUVI_LOG_INTERVAL)
+        self.flush_log.start()
+
+    async def cog_unload(self):
+        self.removals.close()
+        self.flush_log.cancel()
+        await self._send_log()
+
+    # ─────────────────────────────────────────────
+    # Rules
+    # ─────────────────────────────────────────────
+
+    @staticmethod
+    def fails_requirements(member: discord.Member) -> bool:
+        role_ids = {r.id for r in member.roles}
+        return ROLE_TIER_3 in role_ids and not role_ids & REQUIRED_ROLES_FOR_T3
+
+    async def _remove_t3(self, member_id: int, guild: discord.Guild):
+        member  = guild.get_member(member_id)
+        role_t3 = guild.get_role(ROLE_TIER_3)
+        # Re-check: the member may have regained a required role while queued
+        if not member or not role_t3 or not self.fails_requirements(member):
+            return
+        try:
+            await member.remove_roles(role_t3, reason="Failed Luvi check")
+        except discord.Forbidden:
+            log.error("❌ Missing permissions to remove Tier 3 from %s", member.display_name)
+            return
+        self.removed.append(member)
+        log.info("🔻 Removed Tier 3 from %s", member.display_name)
+
+    # ─────────────────────────────────────────────
+    # Event-driven enforcement
+    # ─────────────────────────────────────────────
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if not LUVI_AUTO_ENFORCE or before.roles == after.roles:
+            return
+        if self.fails_requirements(after):
+            self.removals.put(after.id, after.guild)
+
+    # ─────────────────────────────────────────────
+    # /luvi_check — full reconciliation
+    # ─────────────────────────────────────────────
 
     @app_commands.command(
         name="luvi_check",
@@ -19,36 +72,50 @@ class LuviChecker(commands.Cog):
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def luvi_check(self, interaction: discord.Interaction):
+        guild = interaction.guild
+
+        # Tier 3 holders minus everyone holding at least one required role
+        failing = self.index.members(guild, ROLE_TIER_3) - self.index.union(guild, REQUIRED_ROLES_FOR_T3)
+        for member_id in failing:
+            self.removals.put(member_id, guild)
+
         await interaction.response.send_message(
-            embed=LilacEmbed.info("Luvi check started", "Scanning members… this may take a moment."),
+            embed=LilacEmbed.info(
+                "Luvi check started",
+                f"**{len(failing)}** member(s) queued for Tier 3 removal. "
+                "Results are posted to the log channel in batches.",
+            ),
             ephemeral=True,
         )
 
-        guild        = interaction.guild
-        log_channel  = guild.get_channel(LOG_CHANNEL_ID)
-        role_t3      = guild.get_role(ROLE_TIER_3)
-        removed      = []
-
-        for member in guild.members:
-            if role_t3 not in member.roles:
-                continue
-            if not any(r.id in REQUIRED_ROLES_FOR_T3 for r in member.roles):
-                try:
-                    await member.remove_roles(role_t3, reason="Failed Luvi check")
-                    removed.append(member)
-                except Exception:
-                    pass
+        if not failing:
+            log_channel = guild.get_channel(LOG_CHANNEL_ID)
+            if log_channel:
+                await log_channel.send(
+                    embed=LilacEmbed.success(
+                        "Luvi Check — No changes",
+                        "All Tier 3 members meet the requirements. ✅",
+                    )
+                )
 
-        if not log_channel:
-            return
+    # ─────────────────────────────────────────────
+    # Batched log
+    # ─────────────────────────────────────────────
 
-        if not removed:
-            await log_channel.send(
-                embed=LilacEmbed.success(
-                    "Luvi Check — No changes",
-                    "All Tier 3 members meet the requirements. ✅",
-                )
-            )
+    @tasks.loop(seconds=300)
+    async def flush_log(self):
+        await self._send_log()
+
+    @flush_log.before_loop
+    async def before_flush_log(self):
+        await self.bot.wait_until_ready()
+
+    async def _send_log(self):
+        if not self.removed:
+            return
+        removed, self.removed = self.removed, []
+        log_channel = removed[0].guild.get_channel(LOG_CHANNEL_ID)
+        if not log_channel:
             return
 
         # Send results in pages of 25
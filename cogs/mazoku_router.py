@@ -0,0 +1,28 @@
+import logging
+import discord
+from discord.ext import commands
+
+from config import MAZOKU_BOT_ID
+
+log = logging.getLogger("cog-mazoku-router")
+
+
+class MazokuRouterCog(commands.Cog):
+    """Single on_message_edit entry point for Mazoku embeds."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot    = bot
+        self.router = bot.mazoku_router
+
+    @commands.Cog.listener()
+    async def on_message_edit(self, before: discord.Message, after: discord.Message):
+        if after.author.id != MAZOKU_BOT_ID:
+            return
+        if not after.guild or not after.embeds:
+            return
+        await self.router.dispatch(after)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MazokuRouterCog(bot))
+    log.info("⚙️ MazokuRouter cog loaded")
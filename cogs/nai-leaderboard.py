@@ -2,26 +2,39 @@ import re
 import logging
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 from datetime import datetime
 
 from config import NAI_BOT_ID, NAI_TRACK_CHANNELS, Colors
+from utils.board_view import BoardPagerView
 from utils.embed_builder import LilacEmbed, MEDALS
+from utils.leaderboard_engine import BoardView
+from utils.leaderboard_keys import day_expire_at, month_expire_at, nai_board_key, utc_now
+from utils.write_buffer import WriteBuffer
 
 log = logging.getLogger("nai-leaderboard")
 
-NAI_KEY_MAP = {
-    "all":     "nai:leaderboard",
-    "monthly": "nai:monthly",
-    "daily":   "nai:daily",
+# Earlier layouts (hashes, then un-bucketed sorted sets), folded into the
+# current boards on load. Daily/monthly land in today's / this month's bucket.
+NAI_LEGACY_KEYS = {
+    "all":     ("nai:leaderboard",),
+    "monthly": ("nai:monthly", "lb:nai:monthly"),
+    "daily":   ("nai:daily", "lb:nai:daily"),
 }
-NAI_LABELS = {"all": "All Time", "monthly": "Monthly", "daily": "Daily"}
-NAI_EMOJIS = {"all": "🏆", "monthly": "📅", "daily": "☀️"}
+NAI_CATEGORIES = ("all", "monthly", "last_month", "daily", "yesterday")
+NAI_LABELS = {
+    "all":        "All Time",
+    "monthly":    "Monthly",
+    "last_month": "Last Month",
+    "daily":      "Daily",
+    "yesterday":  "Yesterday",
+}
+NAI_EMOJIS = {"all": "🏆", "monthly": "📅", "last_month": "🗓️", "daily": "☀️", "yesterday": "🌙"}
 
 
 def _build_nai_embed(
     category: str,
-    sorted_data: list[tuple[str, str]],
+    board: BoardView,
     guild: discord.Guild,
     user: discord.Member,
 ) -> discord.Embed:
@@ -31,25 +44,18 @@ def _build_nai_embed(
     embed = LilacEmbed(title=f"{emoji}  {label} NAI Leaderboard", color=Colors.GOLD)
     embed.set_guild_thumbnail(guild)
 
-    if not sorted_data:
+    if not board.lines:
         embed.description = "*No data yet!*"
         embed.set_requester_footer(user)
         return embed
 
     user_id_str = str(user.id)
-    user_rank   = next((i for i, (uid, _) in enumerate(sorted_data, 1) if uid == user_id_str), None)
-    lines       = []
-
-    for i, (uid, score) in enumerate(sorted_data[:10], start=1):
-        member  = guild.get_member(int(uid))
-        mention = member.mention if member else f"<@{uid}>"
-        medal   = MEDALS.get(i, f"**`#{i:>2}`**")
-        hl      = " ◀" if uid == user_id_str else ""
-        lines.append(f"{medal}  {mention} — **{score}** points{hl}")
-
-    embed.description = "\n".join(lines)
+    user_rank   = board.rank
+    embed.description = "\n".join(
+        f"{line} ◀" if uid == user_id_str else line for uid, line in board.lines
+    )
 
-    user_score = int(dict(sorted_data).get(user_id_str, 0))
+    user_score = board.score
     if user_rank and user_rank <= 3:
         rank_text = f"{MEDALS[user_rank]} You're on the podium!"
     elif user_rank:
@@ -62,45 +68,62 @@ def _build_nai_embed(
     return embed
 
 
-class NaiLeaderboardView(discord.ui.View):
+class NaiLeaderboardView(BoardPagerView):
+    unit = "points"
+
     def __init__(self, bot: commands.Bot, guild: discord.Guild):
-        super().__init__(timeout=120)
-        self.bot   = bot
-        self.guild = guild
+        super().__init__(bot, guild, "all")
+
+    def board_key(self, category: str) -> str:
+        return nai_board_key(category)
+
+    def build_embed(self, category, board, guild, user):
+        return _build_nai_embed(category, board, guild, user)
 
     @discord.ui.select(
         placeholder="📊  Choose a category…",
         options=[
             discord.SelectOption(label=NAI_LABELS[k], value=k, emoji=NAI_EMOJIS[k])
-            for k in ("all", "monthly", "daily")
+            for k in NAI_CATEGORIES
         ],
+        row=0,
     )
     async def select_callback(self, interaction: discord.Interaction, select: discord.ui.Select):
-        embed = await self._build(select.values[0], interaction.guild, interaction.user)
-        await interaction.response.edit_message(embed=embed, view=self)
-
-    async def _build(self, category: str, guild: discord.Guild, user: discord.Member) -> discord.Embed:
-        if not getattr(self.bot, "redis", None):
-            return LilacEmbed.error("Redis unavailable")
-        data = await self.bot.redis.hgetall(NAI_KEY_MAP[category])
-        if not data:
-            embed = LilacEmbed(title=f"{NAI_EMOJIS[category]}  {NAI_LABELS[category]} NAI Leaderboard", color=Colors.GOLD)
-            embed.description = "*No data yet!*"
-            embed.set_guild_thumbnail(guild)
-            embed.set_requester_footer(user)
-            return embed
-        sorted_data = sorted(data.items(), key=lambda x: int(x[1]), reverse=True)
-        return _build_nai_embed(category, sorted_data, guild, user)
+        await self._show(interaction, select.values[0], 0)
 
 
 class NaiLeaderboard(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.daily_reset_task.start()
+        self.engine = bot.leaderboard_engine
+        self.buffer = WriteBuffer(self._flush, name="nai")
+        # Bucket key → EXPIREAT, collected as events arrive and applied on flush
+        self._bucket_expiry: dict[str, int] = {}
         log.info("⚙️ NaiLeaderboard loaded")
 
-    def cog_unload(self):
-        self.daily_reset_task.cancel()
+    async def cog_load(self):
+        if not getattr(self.bot, "redis", None):
+            return
+        now = utc_now()
+        for category, legacy_keys in NAI_LEGACY_KEYS.items():
+            target = nai_board_key(category, now)
+            for legacy_key in legacy_keys:
+                await self.engine.migrate_board(legacy_key, target)
+        await self.engine.set_expiry(nai_board_key("daily", now), day_expire_at(now))
+        await self.engine.set_expiry(nai_board_key("monthly", now), month_expire_at(now))
+
+    async def cog_unload(self):
+        await self.buffer.close()
+
+    async def _flush(self, batch: dict[tuple[str, str], int]):
+        await self.engine.apply_increments(batch, expire_at=self._bucket_expiry)
+
+    def _track_bucket(self, key: str, expire_at: int, now: datetime):
+        if key in self._bucket_expiry:
+            return
+        cutoff = now.timestamp()
+        self._bucket_expiry = {k: ts for k, ts in self._bucket_expiry.items() if ts > cutoff}
+        self._bucket_expiry[key] = expire_at
 
     # ─────────────────────────────────────────────
     # /nai-leaderboard
@@ -123,27 +146,12 @@ class NaiLeaderboard(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         if not getattr(self.bot, "redis", None):
             return await interaction.followup.send(embed=LilacEmbed.error("Redis unavailable"), ephemeral=True)
-        await self.bot.redis.delete("nai:monthly")
+        await self.engine.reset(nai_board_key("monthly"))
         await interaction.followup.send(
             embed=LilacEmbed.success("Monthly reset", "🧹 NAI monthly leaderboard has been wiped."),
             ephemeral=True,
         )
 
-    # ─────────────────────────────────────────────
-    # Daily reset at midnight
-    # ─────────────────────────────────────────────
-
-    @tasks.loop(minutes=1)
-    async def daily_reset_task(self):
-        now = datetime.now()
-        if now.hour == 0 and now.minute == 0 and getattr(self.bot, "redis", None):
-            await self.bot.redis.delete("nai:daily")
-            log.info("🕛 NAI daily leaderboard reset at midnight")
-
-    @daily_reset_task.before_loop
-    async def before_daily_reset(self):
-        await self.bot.wait_until_ready()
-
     # ─────────────────────────────────────────────
     # Listener
     # ─────────────────────────────────────────────
@@ -160,8 +168,13 @@ class NaiLeaderboard(commands.Cog):
             return
 
         user_id = match.group(1)
-        for key in ("nai:leaderboard", "nai:monthly", "nai:daily"):
-            await self.bot.redis.hincrby(key, user_id, 1)
+        now     = utc_now()
+        daily   = nai_board_key("daily", now)
+        monthly = nai_board_key("monthly", now)
+        self._track_bucket(daily, day_expire_at(now), now)
+        self._track_bucket(monthly, month_expire_at(now), now)
+        for key in (nai_board_key("all", now), daily, monthly):
+            self.buffer.add((key, user_id))
         log.info("NAI +1 → %s", user_id)
 
 
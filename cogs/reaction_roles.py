@@ -1,3 +1,6 @@
+import re
+import asyncio
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -5,17 +8,46 @@ from discord import app_commands
 from config import (
     AUTOROLE_MESSAGE_ID,
     ROLE_TIER_1, ROLE_TIER_2, ROLE_TIER_3,
-    REQUIRED_ROLES_FOR_T3,
     TARGET_CHANNEL_ID,
     BOT_ID,
     Colors,
+    REACTION_DEBOUNCE_SECONDS,
+    REACTION_QUEUE_INTERVAL,
 )
 from utils.embed_builder import LilacEmbed
+from utils.rate_queue import RateLimitedQueue
+from utils.reaction_panels import Panel, default_panel
+
+log = logging.getLogger("cog-reaction-roles")
+
+ROLE_ID_REGEX = re.compile(r"\d{15,20}")
+
+CLEAN_CONCURRENCY = 4    # parallel removals when bulk clearing is not allowed
+PROGRESS_INTERVAL = 5.0  # seconds between progress edits
 
 
 class SimpleReactionRoles(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.panels = bot.reaction_panels
+        # (channel id, message id) → partial panel message; removing a reaction
+        # through it is a single DELETE, with no GET of the message first
+        self._messages: dict[tuple[int, int], discord.PartialMessage] = {}
+        # member id → {role id: should have} once the debounce ends
+        self._desired: dict[int, dict[int, bool]] = {}
+        self._timers: dict[int, asyncio.TimerHandle] = {}
+        # Role edits ("roles", member_id) and reaction removals
+        # ("reaction", channel_id, message_id, member_id, emoji) share one paced queue
+        self.queue = RateLimitedQueue(self._run_job, name="reaction-roles", interval=REACTION_QUEUE_INTERVAL)
+
+    async def cog_load(self):
+        await self.panels.seed_default()
+        await self.panels.load_all()
+
+    def cog_unload(self):
+        for timer in self._timers.values():
+            timer.cancel()
+        self.queue.close()
 
     # ── /sendautorole ─────────────────────────────────────────
 
@@ -45,9 +77,14 @@ class SimpleReactionRoles(commands.Cog):
         )
         embed.set_footer(text="Tier 3 requires a special rank — keep grinding!")
 
+        panel = default_panel()
         msg = await channel.send(embed=embed)
-        for emoji in ("1️⃣", "2️⃣", "3️⃣"):
+        for emoji in panel.roles:
             await msg.add_reaction(emoji)
+        # Register the new message as the boss-ping panel right away
+        if getattr(self.bot, "redis", None):
+            panel.message_id, panel.channel_id = msg.id, channel.id
+            await self.panels.save(panel)
 
         await interaction.response.send_message(
             embed=LilacEmbed.success(
@@ -59,58 +96,215 @@ class SimpleReactionRoles(commands.Cog):
 
     # ── Helpers ───────────────────────────────────────────────
 
-    async def _remove_reaction(self, payload: discord.RawReactionActionEvent):
-        guild   = self.bot.get_guild(payload.guild_id)
-        channel = guild.get_channel(payload.channel_id)
-        msg     = await channel.fetch_message(payload.message_id)
+    def _panel_message(self, channel_id: int, message_id: int) -> discord.PartialMessage | None:
+        msg = self._messages.get((channel_id, message_id))
+        if msg is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                return None
+            msg = self._messages[(channel_id, message_id)] = channel.get_partial_message(message_id)
+        return msg
+
+    def _remove_reaction(self, payload: discord.RawReactionActionEvent):
+        key = ("reaction", payload.channel_id, payload.message_id, payload.user_id, str(payload.emoji))
+        self.queue.put(key, payload.emoji)
+
+    async def _run_job(self, key: tuple, payload):
+        if key[0] == "roles":
+            await self._apply_roles(key[1], payload)
+            return
+
+        _, channel_id, message_id, user_id, _ = key
+        msg = self._panel_message(channel_id, message_id)
+        if msg is None:
+            return
         try:
-            await msg.remove_reaction(payload.emoji, payload.member)
+            await msg.remove_reaction(payload, discord.Object(id=user_id))
+        except discord.HTTPException as e:
+            if e.status == 429:
+                raise  # the queue backs off and retries
         except Exception:
             pass
 
+    def _commit(self, member_id: int, guild_id: int):
+        self._timers.pop(member_id, None)
+        self.queue.put(("roles", member_id), guild_id)
+
+    async def _apply_roles(self, member_id: int, guild_id: int):
+        """Applies the member's net toggles as one role edit."""
+        desired = self._desired.pop(member_id, None)
+        guild   = self.bot.get_guild(guild_id)
+        member  = guild.get_member(member_id) if guild else None
+        if desired is None or member is None:
+            return
+
+        current   = {r.id for r in member.roles}
+        to_add    = {r for r, want in desired.items() if want and r not in current}
+        to_remove = {r for r, want in desired.items() if not want and r in current}
+        if not to_add and not to_remove:
+            return  # toggles cancelled out
+
+        roles = [r for r in member.roles if not r.is_default() and r.id not in to_remove]
+        roles += [role for role_id in to_add if (role := guild.get_role(role_id))]
+        await member.edit(roles=roles, reason="Reaction roles")
+
     # ── Reaction add (toggle) ─────────────────────────────────
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
-        if payload.message_id != AUTOROLE_MESSAGE_ID:
+        panel = self.panels.get(payload.message_id)
+        if panel is None or payload.user_id == BOT_ID:
             return
-        if payload.user_id == BOT_ID:
+
+        role_id = panel.roles.get(str(payload.emoji))
+        if role_id is None:
             return
 
         guild  = self.bot.get_guild(payload.guild_id)
-        member = guild.get_member(payload.user_id)
-        emoji  = str(payload.emoji)
-
-        role_map = {
-            "1️⃣": ROLE_TIER_1,
-            "2️⃣": ROLE_TIER_2,
-            "3️⃣": ROLE_TIER_3,
-        }
-        if emoji not in role_map:
+        member = payload.member or guild.get_member(payload.user_id)
+        role   = guild.get_role(role_id)
+        if member is None or role is None:
             return
 
-        role = guild.get_role(role_map[emoji])
+        desired = self._desired.get(member.id, {})
+        want    = not desired.get(role.id, role in member.roles)
 
-        # Tier 3 gating
-        if emoji == "3️⃣" and role not in member.roles:
-            has_required = any(r.id in REQUIRED_ROLES_FOR_T3 for r in member.roles)
-            if not has_required:
-                await self._remove_reaction(payload)
-                try:
-                    await member.send(
-                        "Keep grinding or join our clan to unlock Tier 3 notifications! 💪"
-                    )
-                except Exception:
-                    pass
-                return
+        # Gated roles need at least one of the panel's required roles
+        required = panel.gates.get(role.id)
+        if want and required and not any(r.id in required for r in member.roles):
+            self._remove_reaction(payload)
+            try:
+                await member.send(panel.gate_message)
+            except Exception:
+                pass
+            return
+
+        # Toggle in memory; the net result is applied once the member goes quiet
+        self._desired[member.id] = {**desired, role.id: want}
+        if ("roles", member.id) not in self.queue:
+            timer = self._timers.pop(member.id, None)
+            if timer:
+                timer.cancel()
+            self._timers[member.id] = asyncio.get_running_loop().call_later(
+                REACTION_DEBOUNCE_SECONDS, self._commit, member.id, guild.id
+            )
+
+        self._remove_reaction(payload)
+
+    # ── /reaction-panel ───────────────────────────────────────
+
+    panel_group = app_commands.Group(
+        name="reaction-panel",
+        description="Manage reaction-role panels (admin).",
+        default_permissions=discord.Permissions(administrator=True),
+    )
+
+    @panel_group.command(name="bind", description="Bind an emoji on a message to a role.")
+    @app_commands.describe(
+        message_id="ID of the panel message",
+        emoji="Emoji members react with",
+        role="Role toggled by the emoji",
+        requires="Optional roles (mentions or IDs) of which one is needed to get this role",
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def panel_bind(
+        self,
+        interaction: discord.Interaction,
+        channel: discord.TextChannel,
+        message_id: str,
+        emoji: str,
+        role: discord.Role,
+        requires: str | None = None,
+    ):
+        if not message_id.isdigit() or not getattr(self.bot, "redis", None):
+            return await interaction.response.send_message(
+                embed=LilacEmbed.error("Invalid request", "Check the message ID and that Redis is connected."),
+                ephemeral=True,
+            )
+        panel = self.panels.get(int(message_id)) or Panel(message_id=int(message_id), channel_id=channel.id)
+        if panel.channel_id != channel.id:
+            return await interaction.response.send_message(
+                embed=LilacEmbed.error(
+                    "Wrong channel", f"Message `{message_id}` is a panel in <#{panel.channel_id}>."
+                ),
+                ephemeral=True,
+            )
+        await interaction.response.defer(ephemeral=True)
+
+        panel.roles[emoji] = role.id
+        if requires:
+            panel.gates[role.id] = frozenset(int(x) for x in ROLE_ID_REGEX.findall(requires))
+        else:
+            panel.gates.pop(role.id, None)
+        await self.panels.save(panel)
+
+        try:
+            await channel.get_partial_message(panel.message_id).add_reaction(emoji)
+        except discord.HTTPException:
+            pass
+        await interaction.followup.send(
+            embed=LilacEmbed.success("Panel updated", f"{emoji} → {role.mention} on message `{message_id}`."),
+            ephemeral=True,
+        )
+        log.info("🧷 Bound %s to role %s on panel %s", emoji, role.id, message_id)
 
-        # Toggle
-        if role in member.roles:
-            await member.remove_roles(role)
+    @panel_group.command(name="unbind", description="Remove an emoji binding from a panel.")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def panel_unbind(self, interaction: discord.Interaction, message_id: str, emoji: str):
+        if not getattr(self.bot, "redis", None):
+            return await interaction.response.send_message(
+                embed=LilacEmbed.error("Redis unavailable", "Panels can't be changed while Redis is disconnected."),
+                ephemeral=True,
+            )
+        panel = self.panels.get(int(message_id)) if message_id.isdigit() else None
+        if panel is None or emoji not in panel.roles:
+            return await interaction.response.send_message(
+                embed=LilacEmbed.error("Binding not found"), ephemeral=True
+            )
+        panel.gates.pop(panel.roles.pop(emoji), None)
+        if panel.roles:
+            await self.panels.save(panel)
         else:
-            await member.add_roles(role)
+            await self.panels.delete(panel.message_id)
+        await interaction.response.send_message(
+            embed=LilacEmbed.success("Panel updated", f"{emoji} no longer toggles a role."), ephemeral=True
+        )
+
+    @panel_group.command(name="delete", description="Stop treating a message as a reaction-role panel.")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def panel_delete(self, interaction: discord.Interaction, message_id: str):
+        if not getattr(self.bot, "redis", None):
+            return await interaction.response.send_message(
+                embed=LilacEmbed.error("Redis unavailable", "Panels can't be changed while Redis is disconnected."),
+                ephemeral=True,
+            )
+        if not message_id.isdigit() or self.panels.get(int(message_id)) is None:
+            return await interaction.response.send_message(
+                embed=LilacEmbed.error("Panel not found"), ephemeral=True
+            )
+        await self.panels.delete(int(message_id))
+        await interaction.response.send_message(
+            embed=LilacEmbed.success("Panel deleted", f"Message `{message_id}` is no longer a panel."),
+            ephemeral=True,
+        )
 
-        await self._remove_reaction(payload)
+    @panel_group.command(name="list", description="List every reaction-role panel.")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def panel_list(self, interaction: discord.Interaction):
+        embed = LilacEmbed(title="🧷  Reaction-role panels", color=Colors.LILAC)
+        for panel in self.panels.panels.values():
+            lines = [
+                f"{emoji} → <@&{role_id}>" + (" 🔒" if role_id in panel.gates else "")
+                for emoji, role_id in panel.roles.items()
+            ]
+            embed.add_field(
+                name=f"Message {panel.message_id}",
+                value=f"<#{panel.channel_id}>\n" + "\n".join(lines),
+                inline=False,
+            )
+        if not embed.fields:
+            embed.description = "*No panels configured.*"
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
     # ── /clean_autorole_reactions ─────────────────────────────
 
@@ -120,30 +314,87 @@ class SimpleReactionRoles(commands.Cog):
     )
     @app_commands.checks.has_permissions(administrator=True)
     async def clean_autorole_reactions(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True, thinking=True)
         channel = interaction.guild.get_channel(TARGET_CHANNEL_ID)
         if not channel:
-            return await interaction.response.send_message(
-                embed=LilacEmbed.error("Channel not found"), ephemeral=True
-            )
+            return await interaction.followup.send(embed=LilacEmbed.error("Channel not found"), ephemeral=True)
         try:
             msg = await channel.fetch_message(AUTOROLE_MESSAGE_ID)
         except Exception:
-            return await interaction.response.send_message(
-                embed=LilacEmbed.error("Message not found"), ephemeral=True
+            return await interaction.followup.send(embed=LilacEmbed.error("Message not found"), ephemeral=True)
+
+        # One call wipes every reaction; the bot's own are put back afterwards
+        note = "All user reactions have been removed."
+        try:
+            await msg.clear_reactions()
+        except discord.Forbidden:
+            # Removing anyone else's reaction needs the same permission
+            return await interaction.edit_original_response(
+                embed=LilacEmbed.error(
+                    "Missing permission",
+                    f"I need **Manage Messages** in <#{TARGET_CHANNEL_ID}> to clear reactions.",
+                ),
             )
+        except discord.HTTPException as e:
+            log.warning("⚠️ Bulk reaction clear failed (%s), removing per user", e)
+            msg = await channel.fetch_message(AUTOROLE_MESSAGE_ID)   # what is left after a partial clear
+            removed, failed = await self._remove_user_reactions(interaction, msg)
+            note = f"Removed **{removed}** user reaction(s) one by one."
+            if failed:
+                note += f" **{failed}** could not be removed."
 
-        for reaction in msg.reactions:
-            async for user in reaction.users():
-                if user.id != BOT_ID and not user.bot:
-                    try:
-                        await msg.remove_reaction(reaction.emoji, user)
-                    except Exception:
-                        pass
+        panel = self.panels.get(AUTOROLE_MESSAGE_ID) or default_panel()
+        for emoji in panel.roles:
+            try:
+                await msg.add_reaction(emoji)
+            except discord.HTTPException:
+                pass
 
-        await interaction.response.send_message(
-            embed=LilacEmbed.success("Reactions cleaned", "All user reactions have been removed."),
-            ephemeral=True,
-        )
+        await interaction.edit_original_response(embed=LilacEmbed.success("Reactions cleaned", note))
+
+    async def _remove_user_reactions(
+        self, interaction: discord.Interaction, msg: discord.Message
+    ) -> tuple[int, int]:
+        """
+        Fallback when the bulk clear fails for a transient reason: removes
+        reactions per user with bounded concurrency, reporting progress.
+        Returns (removed, failed); only successful removals are counted.
+        """
+        targets = [
+            (reaction.emoji, user)
+            for reaction in msg.reactions
+            async for user in reaction.users()
+            if user.id != BOT_ID and not user.bot
+        ]
+        semaphore = asyncio.Semaphore(CLEAN_CONCURRENCY)
+        removed, failed = 0, 0
+
+        async def remove(emoji, user):
+            nonlocal removed, failed
+            async with semaphore:
+                try:
+                    await msg.remove_reaction(emoji, user)
+                except discord.HTTPException:
+                    failed += 1
+                else:
+                    removed += 1
+
+        async def report():
+            while True:
+                await asyncio.sleep(PROGRESS_INTERVAL)
+                try:
+                    await interaction.edit_original_response(
+                        embed=LilacEmbed.info("Cleaning reactions", f"Removed **{removed}/{len(targets)}**…"),
+                    )
+                except discord.HTTPException:
+                    pass
+
+        reporter = asyncio.create_task(report())
+        try:
+            await asyncio.gather(*(remove(emoji, user) for emoji, user in targets))
+        finally:
+            reporter.cancel()
+        return removed, failed
 
     # ── /fix_autorole_reactions ───────────────────────────────
 
@@ -170,7 +421,8 @@ class SimpleReactionRoles(commands.Cog):
                 await reaction.clear()
             except Exception:
                 pass
-        for emoji in ("1️⃣", "2️⃣", "3️⃣"):
+        panel = self.panels.get(AUTOROLE_MESSAGE_ID) or default_panel()
+        for emoji in panel.roles:
             try:
                 await msg.add_reaction(emoji)
             except Exception:
@@ -184,3 +436,4 @@ class SimpleReactionRoles(commands.Cog):
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(SimpleReactionRoles(bot))
+    log.info("⚙️ SimpleReactionRoles cog loaded")
@@ -1,11 +1,13 @@
-import logging
 import asyncio
+import logging
 import time
-import re
+from functools import partial
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-from config import GUILD_ID, COOLDOWN_SECONDS, PREMIUM_COOLDOWN_SECONDS, REMINDER_CLEANUP_MINUTES
+from config import GUILD_ID, COOLDOWN_SECONDS, PREMIUM_COOLDOWN_SECONDS
+from utils.mazoku_events import LnyPacket, SummonClaimed
+from utils.reminder_store import ReminderStore
 
 log = logging.getLogger("cog-reminder")
 
@@ -15,11 +17,27 @@ LNY_COOLDOWN = 1800  # fixed 30 min for Lunar New Year
 class Reminder(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.active_reminders: dict[tuple[str, int], asyncio.Task] = {}
-        self.cleanup_task.start()
+        self.settings = bot.settings_cache
+        self.stores = {kind: ReminderStore(bot, kind) for kind in ("summon", "lny")}
+        self.scheduler = bot.scheduler
+        self.scheduler.register("summon", partial(self._fire, "summon", self.send_summon_reminder))
+        self.scheduler.register("lny", partial(self._fire, "lny", self.send_lny_reminder))
+        self.router = bot.mazoku_router
+        self.router.subscribe(SummonClaimed, self.on_summon_claimed)
+        self.router.subscribe(LnyPacket, self.on_lny_packet)
+        self._restore: asyncio.Task | None = None
+
+    async def cog_load(self):
+        # Guild, members and channels only exist once the gateway is ready
+        self._restore = asyncio.create_task(self.restore_reminders())
 
     def cog_unload(self):
-        self.cleanup_task.cancel()
+        if self._restore:
+            self._restore.cancel()
+        self.scheduler.unregister("summon")
+        self.scheduler.unregister("lny")
+        self.router.unsubscribe(SummonClaimed, self.on_summon_claimed)
+        self.router.unsubscribe(LnyPacket, self.on_lny_packet)
 
     # ─────────────────────────────────────────────
     # Premium helpers
@@ -27,12 +45,7 @@ class Reminder(commands.Cog):
 
     async def is_premium(self, member: discord.Member) -> bool:
         """Retourne True si l'utilisateur a activé le mode premium."""
-        if not getattr(self.bot, "redis", None):
-            return False
-        val = await self.bot.redis.get(
-            f"reminder:settings:{member.guild.id}:{member.id}:premium"
-        )
-        return val == "1"
+        return await self.settings.get(member.guild.id, member.id, "premium") == "1"
 
     async def get_summon_cooldown(self, member: discord.Member) -> int:
         """Retourne le cooldown en secondes selon le statut premium."""
@@ -74,12 +87,7 @@ class Reminder(commands.Cog):
     # ─────────────────────────────────────────────
 
     async def is_summon_enabled(self, member: discord.Member) -> bool:
-        if not getattr(self.bot, "redis", None):
-            return True
-        val = await self.bot.redis.get(
-            f"reminder:settings:{member.guild.id}:{member.id}:summon"
-        )
-        return val != "0"
+        return await self.settings.get(member.guild.id, member.id, "summon") != "0"
 
     # ─────────────────────────────────────────────
     # Start reminders
@@ -91,137 +99,78 @@ class Reminder(commands.Cog):
         member: discord.Member,
         channel: discord.TextChannel,
         delay: int,
-        send_fn,
     ):
-        rkey     = (kind, member.id)
-        redis_key = f"reminder:{kind}:{member.id}"
-
-        if rkey in self.active_reminders:
+        if self.scheduler.is_scheduled(kind, member.id):
             return
 
-        if getattr(self.bot, "redis", None):
-            await self.bot.redis.hset(
-                redis_key,
-                mapping={"expire_at": int(time.time()) + delay, "channel_id": channel.id},
-            )
+        expire_at = int(time.time()) + delay
+        await self.stores[kind].add(member.id, expire_at, channel.id)
 
-        async def _task():
-            try:
-                await asyncio.sleep(delay)
-                if kind == "summon" and not await self.is_summon_enabled(member):
-                    return
-                await send_fn(member, channel)
-            finally:
-                self.active_reminders.pop(rkey, None)
-                if getattr(self.bot, "redis", None):
-                    await self.bot.redis.delete(redis_key)
-
-        self.active_reminders[rkey] = asyncio.create_task(_task())
+        self.scheduler.schedule(kind, member.id, expire_at, channel)
         log.info("▶️ %s reminder started for %s (%ss)", kind, member.display_name, delay)
 
+    async def _fire(self, kind: str, send_fn, user_id: int, channel: discord.TextChannel):
+        """Scheduler callback — sends the reminder once it is due."""
+        try:
+            member = channel.guild.get_member(user_id)
+            if not member:
+                return
+            if kind == "summon" and not await self.is_summon_enabled(member):
+                return
+            await send_fn(member, channel)
+        finally:
+            await self.stores[kind].remove(user_id)
+
     async def start_summon_reminder(self, member: discord.Member, channel: discord.TextChannel):
         if not await self.is_summon_enabled(member):
             return
         delay = await self.get_summon_cooldown(member)
-        await self._start_reminder("summon", member, channel, delay, self.send_summon_reminder)
+        await self._start_reminder("summon", member, channel, delay)
 
     async def start_lny_reminder(self, member: discord.Member, channel: discord.TextChannel):
-        await self._start_reminder("lny", member, channel, LNY_COOLDOWN, self.send_lny_reminder)
+        await self._start_reminder("lny", member, channel, LNY_COOLDOWN)
 
     # ─────────────────────────────────────────────
     # Restore after restart
     # ─────────────────────────────────────────────
 
     async def restore_reminders(self):
-        if not getattr(self.bot, "redis", None):
-            return
-        now = int(time.time())
+        await self.bot.wait_until_ready()
         guild = self.bot.get_guild(GUILD_ID)
         if not guild:
+            log.warning("⚠️ Guild %s not found, reminders not restored", GUILD_ID)
             return
 
-        for kind, send_fn in (("summon", self.send_summon_reminder), ("lny", self.send_lny_reminder)):
-            keys = await self.bot.redis.keys(f"reminder:{kind}:*")
-            for redis_key in keys:
-                try:
-                    user_id = int(redis_key.split(":")[-1])
-                except ValueError:
-                    continue
-
-                data = await self.bot.redis.hgetall(redis_key)
-                if not data:
-                    continue
-
-                remaining = int(data.get("expire_at", 0)) - now
-                if remaining <= 0:
-                    await self.bot.redis.delete(redis_key)
-                    continue
-
+        for kind, store in self.stores.items():
+            for user_id, expire_at, channel_id in await store.load_pending():
                 member  = guild.get_member(user_id)
-                channel = guild.get_channel(int(data.get("channel_id", 0)))
+                channel = guild.get_channel(channel_id)
                 if not member or not channel:
+                    await store.remove(user_id)   # would never fire
                     continue
 
-                await self._start_reminder(kind, member, channel, remaining, send_fn)
-                log.info("♻️ Restored %s reminder for %s (%ss left)", kind, member.display_name, remaining)
+                self.scheduler.schedule(kind, user_id, expire_at, channel)
+                log.info(
+                    "♻️ Restored %s reminder for %s (%ss left)",
+                    kind, member.display_name, expire_at - int(time.time()),
+                )
 
     # ─────────────────────────────────────────────
-    # Cleanup expired Redis keys
+    # Mazoku events
     # ─────────────────────────────────────────────
 
-    @tasks.loop(minutes=REMINDER_CLEANUP_MINUTES)
-    async def cleanup_task(self):
-        if not getattr(self.bot, "redis", None):
-            return
-        now = int(time.time())
-        for kind in ("summon", "lny"):
-            for redis_key in await self.bot.redis.keys(f"reminder:{kind}:*"):
-                data = await self.bot.redis.hgetall(redis_key)
-                expire_at = int(data.get("expire_at", 0)) if data else 0
-                if expire_at and expire_at <= now:
-                    await self.bot.redis.delete(redis_key)
-
-    @cleanup_task.before_loop
-    async def before_cleanup(self):
-        await self.bot.wait_until_ready()
+    async def on_summon_claimed(self, event: SummonClaimed):
+        member = event.message.guild.get_member(event.user_id)
+        if member:
+            await self.start_summon_reminder(member, event.message.channel)
 
-    # ─────────────────────────────────────────────
-    # Listener
-    # ─────────────────────────────────────────────
-
-    @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if not after.guild or not after.embeds:
-            return
-
-        embed  = after.embeds[0]
-        title  = (embed.title or "").lower()
-        desc   = embed.description or ""
-        footer = embed.footer.text.lower() if embed.footer and embed.footer.text else ""
-
-        # Summon detection
-        if "summon claimed" in title and "auto summon claimed" not in title:
-            match = re.search(r"<@!?(\d+)>", desc) or (
-                re.search(r"<@!?(\d+)>", footer) if "claimed by" in footer else None
-            )
-            if match:
-                member = after.guild.get_member(int(match.group(1)))
-                if member:
-                    await self.start_summon_reminder(member, after.channel)
-
-        # Lunar New Year detection
-        lny_match = re.search(
-            r"<@!?(\d+)>\s+sent a\s+<:[^:]+:\d+>\s+red packet to\s+<@!?(\d+)>", desc
-        )
-        if lny_match:
-            sender = after.guild.get_member(int(lny_match.group(1)))
-            if sender:
-                await self.start_lny_reminder(sender, after.channel)
-                log.info("🎁 LNY red packet detected: reminder for %s", sender.display_name)
+    async def on_lny_packet(self, event: LnyPacket):
+        sender = event.message.guild.get_member(event.sender_id)
+        if sender:
+            await self.start_lny_reminder(sender, event.message.channel)
+            log.info("🎁 LNY red packet detected: reminder for %s", sender.display_name)
 
 
 async def setup(bot: commands.Bot):
-    cog = Reminder(bot)
-    await bot.add_cog(cog)
-    await cog.restore_reminders()
+    await bot.add_cog(Reminder(bot))
     log.info("⚙️ Reminder cog loaded (Summon + LNY)")
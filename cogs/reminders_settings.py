@@ -5,12 +5,15 @@ Allows users to configure their reminder preferences:
   - Toggle premium mode (15 min cooldown vs 30 min default)
 """
 
+import asyncio
 import logging
 import discord
 from discord import app_commands
 from discord.ext import commands
 
 from config import COOLDOWN_SECONDS, PREMIUM_COOLDOWN_SECONDS, GUILD_ID
+from utils.embed_builder import LilacEmbed
+from utils.settings_cache import migrate_legacy_settings
 
 log = logging.getLogger("cog-reminders-settings")
 
@@ -18,23 +21,36 @@ log = logging.getLogger("cog-reminders-settings")
 class RemindersSettings(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.settings = bot.settings_cache
+        self._migration: asyncio.Task | None = None
+
+    async def cog_load(self):
+        # Fold legacy per-setting keys in the background; until it finishes,
+        # SettingsCache falls back to the legacy keys on read.
+        if getattr(self.bot, "redis", None):
+            self._migration = asyncio.create_task(self._migrate_on_load())
+
+    async def cog_unload(self):
+        if self._migration:
+            self._migration.cancel()
+
+    async def _migrate_on_load(self):
+        try:
+            migrated = await migrate_legacy_settings(self.bot.redis)
+        except Exception:
+            log.exception("❌ Automatic migration of legacy reminder settings failed")
+            return
+        if migrated:
+            await self.settings.broadcast_clear()
+            log.info("🔁 Migrated %s legacy reminder setting keys on load", migrated)
 
     # ─────────────────────────────────────────────
     # Redis helpers
     # ─────────────────────────────────────────────
 
-    def _key(self, guild_id: int, user_id: int, setting: str) -> str:
-        return f"reminder:settings:{guild_id}:{user_id}:{setting}"
-
-    async def _get(self, guild_id: int, user_id: int, setting: str) -> str | None:
-        if not getattr(self.bot, "redis", None):
-            return None
-        return await self.bot.redis.get(self._key(guild_id, user_id, setting))
-
     async def _set(self, guild_id: int, user_id: int, setting: str, value: str):
-        if not getattr(self.bot, "redis", None):
-            return
-        await self.bot.redis.set(self._key(guild_id, user_id, setting), value)
+        """Writes the setting and broadcasts a cache invalidation to every instance."""
+        await self.settings.set(guild_id, user_id, setting, value)
 
     # ─────────────────────────────────────────────
     # /reminders group
@@ -55,14 +71,10 @@ class RemindersSettings(commands.Cog):
             )
             return
 
-        guild_id = interaction.guild_id
-        user_id  = interaction.user.id
+        settings = await self.settings.get_all(interaction.guild_id, interaction.user.id)
 
-        summon_val  = await self._get(guild_id, user_id, "summon")
-        premium_val = await self._get(guild_id, user_id, "premium")
-
-        summon_enabled  = summon_val != "0"
-        premium_enabled = premium_val == "1"
+        summon_enabled  = settings["summon"] != "0"
+        premium_enabled = settings["premium"] == "1"
 
         cooldown_min = PREMIUM_COOLDOWN_SECONDS // 60 if premium_enabled else COOLDOWN_SECONDS // 60
 
@@ -148,6 +160,33 @@ class RemindersSettings(commands.Cog):
             interaction.guild_id,
         )
 
+    # ─────────────────────────────────────────────
+    # /reminders-migrate (admin)
+    # ─────────────────────────────────────────────
+
+    @app_commands.command(
+        name="reminders-migrate",
+        description="Re-run the legacy reminder settings migration (runs automatically on load) (admin).",
+    )
+    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.checks.has_permissions(administrator=True)
+    async def reminders_migrate(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        if not getattr(self.bot, "redis", None):
+            return await interaction.followup.send(embed=LilacEmbed.error("Redis unavailable"), ephemeral=True)
+
+        migrated = await migrate_legacy_settings(self.bot.redis)
+        await self.settings.broadcast_clear()
+
+        await interaction.followup.send(
+            embed=LilacEmbed.success(
+                "Migration complete",
+                f"🔁 Folded **{migrated}** legacy setting key(s) into per-user hashes.",
+            ),
+            ephemeral=True,
+        )
+        log.info("🔁 Migrated %s legacy reminder setting keys", migrated)
+
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(RemindersSettings(bot))
@@ -0,0 +1,53 @@
+import logging
+import discord
+from discord.ext import commands
+
+log = logging.getLogger("cog-role-index")
+
+
+class RoleIndexListener(commands.Cog):
+    """Keeps the shared role → member index in step with the gateway."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot   = bot
+        self.index = bot.role_index
+
+    async def cog_load(self):
+        if self.bot.is_ready():
+            for guild in self.bot.guilds:
+                self.index.build(guild)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            self.index.build(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self.index.build(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.index.forget_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.index.update_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            self.index.update_member(after)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.index.remove_member(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.index.remove_role(role.guild.id, role.id)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(RoleIndexListener(bot))
+    log.info("⚙️ RoleIndexListener cog loaded")
@@ -54,13 +54,45 @@ LOG_CHANNEL_ID      = int(os.getenv("LOG_CHANNEL_ID",      "1421465080238964796"
 COOLDOWN_SECONDS         = int(os.getenv("COOLDOWN_SECONDS",         "1800"))  # 30 min (default)
 PREMIUM_COOLDOWN_SECONDS = int(os.getenv("PREMIUM_COOLDOWN_SECONDS", "900"))   # 15 min (premium)
 HIGH_TIER_COOLDOWN       = int(os.getenv("HIGH_TIER_COOLDOWN",       "300"))
-REMINDER_CLEANUP_MINUTES = int(os.getenv("REMINDER_CLEANUP_MINUTES", "10"))
 REDIS_TTL                = int(os.getenv("REDIS_TTL",                str(60 * 60 * 24 * 7)))
 
+# ─────────────────────────────────────────────
+# Role sync
+# ─────────────────────────────────────────────
+# Concurrent role edits during a full scan; discord.py paces each one from
+# Discord's rate-limit headers, so this only bounds how many wait at once
+AUTOROLE_SCAN_WORKERS  = int(os.getenv("AUTOROLE_SCAN_WORKERS",  "4"))
+AUTOROLE_CACHE_BATCH   = int(os.getenv("AUTOROLE_CACHE_BATCH",   "500"))  # members per pipeline
+# Hash buckets for the autorole cache; keep members/bucket under 128 so each
+# bucket stays listpack-encoded (256 buckets covers ~32k members)
+AUTOROLE_CACHE_BUCKETS = int(os.getenv("AUTOROLE_CACHE_BUCKETS", "256"))
+
+# Tier 3 enforcement: revoke as soon as a member loses every required role,
+# one removal per LUVI_REMOVAL_INTERVAL seconds, logged in batches
+LUVI_AUTO_ENFORCE     = os.getenv("LUVI_AUTO_ENFORCE", "1") == "1"
+LUVI_REMOVAL_INTERVAL = float(os.getenv("LUVI_REMOVAL_INTERVAL", "1.0"))
+LUVI_LOG_INTERVAL     = int(os.getenv("LUVI_LOG_INTERVAL",       "300"))  # seconds
+
+# Reaction roles: toggles from one member are collected for this long and
+# applied as a single role edit; edits and reaction removals share one queue
+REACTION_DEBOUNCE_SECONDS = float(os.getenv("REACTION_DEBOUNCE_SECONDS", "1.5"))
+REACTION_QUEUE_INTERVAL   = float(os.getenv("REACTION_QUEUE_INTERVAL",   "0.25"))
+
+# ─────────────────────────────────────────────
+# In-memory caches
+# ─────────────────────────────────────────────
+SETTINGS_CACHE_SIZE = int(os.getenv("SETTINGS_CACHE_SIZE", "5000"))  # (guild, user) entries
+
+# Write-behind buffers for leaderboard counters: flush after this many
+# seconds or this many buffered events, whichever comes first
+WRITE_BUFFER_MAX_STALENESS = float(os.getenv("WRITE_BUFFER_MAX_STALENESS", "0.5"))
+WRITE_BUFFER_MAX_EVENTS    = int(os.getenv("WRITE_BUFFER_MAX_EVENTS",      "200"))
+
 # ─────────────────────────────────────────────
 # Auction Manager
 # ─────────────────────────────────────────────
 BID_FORWARD_CHANNEL_ID = int(os.getenv("BID_FORWARD_CHANNEL_ID", "1333042802405408789"))
+AUCTION_DURATION_HOURS = float(os.getenv("AUCTION_DURATION_HOURS", "20"))  # lock this long after creation
 FORUM_IDS: dict[str, int] = {
     "Common": int(os.getenv("FORUM_COMMON", "1304507540645740666")),
     "Rare":   int(os.getenv("FORUM_RARE",   "1304507516423766098")),
@@ -6,6 +6,13 @@ from discord.ext import commands
 import redis.asyncio as redis
 
 from config import TOKEN, REDIS_URL, COMMAND_PREFIX
+from utils.leaderboard_engine import LeaderboardEngine
+from utils.mazoku_events import MazokuRouter
+from utils.pubsub import PubSubListener
+from utils.reaction_panels import PanelStore
+from utils.role_index import RoleIndex
+from utils.scheduler import Scheduler
+from utils.settings_cache import SettingsCache
 
 # --- Logging ---
 logging.basicConfig(
@@ -52,6 +59,15 @@ async def setup_hook():
         bot.redis = None
         log.error("❌ Redis connection failed: %s", e)
 
+    # Shared services for all cogs (pub/sub first: the caches subscribe to it)
+    bot.scheduler          = Scheduler()
+    bot.pubsub             = PubSubListener(bot)
+    bot.mazoku_router      = MazokuRouter()
+    bot.role_index         = RoleIndex()
+    bot.leaderboard_engine = LeaderboardEngine(bot)
+    bot.settings_cache     = SettingsCache(bot)
+    bot.reaction_panels    = PanelStore(bot)
+
     # Auto-load all cogs from /cogs
     cog_files = glob.glob("cogs/*.py")
     results = []
@@ -77,6 +93,21 @@ async def setup_hook():
 
 bot.setup_hook = setup_hook
 
+
+# --- Shutdown ---
+_close = bot.close
+
+async def close():
+    # Cogs unload (and flush their buffers) first, then the shared background tasks stop
+    await _close()
+    # Absent if login failed before setup_hook ran
+    for service in (getattr(bot, "scheduler", None), getattr(bot, "pubsub", None)):
+        if service is not None:
+            service.stop()
+    log.info("👋 Shared services stopped")
+
+bot.close = close
+
 # --- Events ---
 @bot.event
 async def on_ready():
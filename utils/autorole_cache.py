@@ -0,0 +1,138 @@
+"""
+utils/autorole_cache.py — Batched access to the autorole state cache
+Remembers, per member, whether they should hold Cross Trade Access so
+repeat checks can skip members that are already correct. Members are spread
+over a fixed number of small hashes (member_id % AUTOROLE_CACHE_BUCKETS):
+each stays within Redis' compact listpack encoding, so a member costs a few
+bytes instead of a whole key. Freshness is tracked per entry: each value
+carries the time it was written and reads older than the TTL count as a
+miss, since the bucket's own TTL is refreshed by every write to any member
+in it. Reads and writes are pipelined in batches, so a full-guild scan costs
+a handful of round trips.
+
+Layout:
+    autorole:{guild}:b:{bucket}   HASH  member_id → "1:{written_at}" | "0:{written_at}",
+                                        idle buckets expire after REDIS_TTL
+
+Usage:
+    cache = AutoroleCache(redis)
+    cached = await cache.get_many(guild.id, [m.id for m in members])   # {member_id: "1" | "0" | None}
+    await cache.set_many(guild.id, {member.id: True})
+"""
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from typing import Iterable
+
+from config import AUTOROLE_CACHE_BATCH, AUTOROLE_CACHE_BUCKETS, REDIS_TTL
+
+
+def _decode(value: str | None, ttl: int, now: float) -> str | None:
+    """Returns "1" / "0" for an entry written within ttl seconds, else None."""
+    state, _, written_at = (value or "").partition(":")
+    if not written_at.isdigit() or now - int(written_at) > ttl:
+        return None
+    return state
+
+
+def bucket_key(guild_id: int, member_id: int, buckets: int = AUTOROLE_CACHE_BUCKETS) -> str:
+    return f"autorole:{guild_id}:b:{member_id % buckets}"
+
+
+class AutoroleCache:
+    def __init__(
+        self,
+        redis,
+        batch_size: int = AUTOROLE_CACHE_BATCH,
+        ttl: int = REDIS_TTL,
+        buckets: int = AUTOROLE_CACHE_BUCKETS,
+    ):
+        self.redis      = redis
+        self.batch_size = batch_size
+        self.ttl        = ttl
+        self.buckets    = buckets
+
+    def _group(self, guild_id: int, member_ids: Iterable[int]) -> dict[str, list[int]]:
+        grouped: dict[str, list[int]] = defaultdict(list)
+        for member_id in member_ids:
+            grouped[bucket_key(guild_id, member_id, self.buckets)].append(member_id)
+        return grouped
+
+    def _batches(self, grouped: dict[str, list]):
+        """Yields lists of (bucket, members) holding roughly batch_size members each."""
+        batch, size = [], 0
+        for key, members in grouped.items():
+            batch.append((key, members))
+            size += len(members)
+            if size >= self.batch_size:
+                yield batch
+                batch, size = [], 0
+        if batch:
+            yield batch
+
+    async def get_many(self, guild_id: int, member_ids: Iterable[int]) -> dict[int, str | None]:
+        result: dict[int, str | None] = {}
+        now = time.time()
+        for batch in self._batches(self._group(guild_id, member_ids)):
+            pipe = self.redis.pipeline(transaction=False)
+            for key, members in batch:
+                pipe.hmget(key, [str(m) for m in members])
+            for (_, members), values in zip(batch, await pipe.execute()):
+                result.update((m, _decode(v, self.ttl, now)) for m, v in zip(members, values))
+        return result
+
+    async def set_many(self, guild_id: int, states: dict[int, bool]):
+        for batch in self._batches(self._group(guild_id, states)):
+            pipe = self.redis.pipeline(transaction=False)
+            written_at = int(time.time())
+            for key, members in batch:
+                pipe.hset(key, mapping={str(m): f"{'1' if states[m] else '0'}:{written_at}" for m in members})
+                pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+
+async def migrate_legacy_autorole(redis, batch_size: int = AUTOROLE_CACHE_BATCH) -> int:
+    """
+    Folds legacy autorole:{guild}:{member} string keys into the bucket hashes.
+    Uses SCAN so Redis stays responsive while the bot keeps running, and
+    HSETNX so a state written through the new layout always wins. A key that
+    is missed or expires meanwhile is just a cache miss. Each entry is stamped
+    with the time the legacy key was written (derived from its remaining TTL),
+    so it ages out on the original schedule. Returns keys migrated.
+    """
+    migrated = 0
+    batch: list[tuple[str, int, int]] = []
+
+    async def _flush():
+        nonlocal migrated
+        if not batch:
+            return
+        pipe = redis.pipeline(transaction=False)
+        for legacy_key, _, _ in batch:
+            pipe.get(legacy_key)
+            pipe.ttl(legacy_key)
+        replies = await pipe.execute()
+
+        now = int(time.time())
+        pipe = redis.pipeline(transaction=False)
+        for (legacy_key, guild_id, member_id), value, ttl in zip(batch, replies[::2], replies[1::2]):
+            if value is not None:
+                key = bucket_key(guild_id, member_id)
+                written_at = now - REDIS_TTL + ttl if ttl > 0 else now
+                pipe.hsetnx(key, str(member_id), f"{value}:{written_at}")
+                pipe.expire(key, REDIS_TTL)
+            pipe.delete(legacy_key)
+        await pipe.execute()
+        migrated += len(batch)
+        batch.clear()
+
+    async for key in redis.scan_iter(match="autorole:*:*", count=batch_size):
+        parts = key.split(":")
+        if len(parts) != 3 or not (parts[1].isdigit() and parts[2].isdigit()):
+            continue
+        batch.append((key, int(parts[1]), int(parts[2])))
+        if len(batch) >= batch_size:
+            await _flush()
+    await _flush()
+    return migrated
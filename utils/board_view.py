@@ -0,0 +1,97 @@
+"""
+utils/board_view.py — Shared paging controls for leaderboard views
+Adds Prev / Next / Jump-to-me buttons on top of a category select. Each
+click fetches only the requested page through the leaderboard engine.
+
+Subclasses provide:
+    board_key(category) → Redis sorted-set key
+    build_embed(category, board, guild, user) → discord.Embed
+    unit → label used in rendered lines ("claims", "points", …)
+    prepare(category) → optional, runs before the board is read
+"""
+from __future__ import annotations
+
+import discord
+from discord.ext import commands
+
+from utils.embed_builder import LilacEmbed, render_board_lines
+from utils.leaderboard_engine import PAGE_SIZE, BoardView
+
+
+class BoardPagerView(discord.ui.View):
+    unit = "claims"
+
+    def __init__(self, bot: commands.Bot, guild: discord.Guild, category: str):
+        super().__init__(timeout=120)
+        self.bot      = bot
+        self.guild    = guild
+        self.engine   = bot.leaderboard_engine
+        self.category = category
+        self.start    = 0
+
+    # ─────────────────────────────────────────────
+    # Subclass hooks
+    # ─────────────────────────────────────────────
+
+    def board_key(self, category: str) -> str:
+        raise NotImplementedError
+
+    async def prepare(self, category: str):
+        """Makes sure the board for `category` exists (e.g. a rolling window)."""
+
+    def build_embed(self, category: str, board: BoardView, guild: discord.Guild, user: discord.Member) -> discord.Embed:
+        raise NotImplementedError
+
+    # ─────────────────────────────────────────────
+    # Building
+    # ─────────────────────────────────────────────
+
+    async def _build(self, category: str, guild: discord.Guild, user: discord.Member, start: int = 0) -> discord.Embed:
+        if not getattr(self.bot, "redis", None):
+            return LilacEmbed.error("Redis unavailable", "The database is not connected.")
+
+        await self.prepare(category)
+        board = await self.engine.view(
+            self.board_key(category), user.id,
+            lambda entries, offset: render_board_lines(entries, offset, guild, unit=self.unit),
+            start=start,
+        )
+        self.category, self.start = category, board.start
+        self._sync_buttons(board)
+
+        embed = self.build_embed(category, board, guild, user)
+        if board.total > PAGE_SIZE:
+            pages = (board.total - 1) // PAGE_SIZE + 1
+            embed.set_requester_footer(user, extra=f"Page {board.start // PAGE_SIZE + 1}/{pages}")
+        return embed
+
+    def _sync_buttons(self, board: BoardView):
+        self.prev_page.disabled = board.start == 0
+        self.next_page.disabled = board.start + PAGE_SIZE >= board.total
+
+    async def _show(self, interaction: discord.Interaction, category: str, start: int):
+        embed = await self._build(category, interaction.guild, interaction.user, start)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    # ─────────────────────────────────────────────
+    # Buttons
+    # ─────────────────────────────────────────────
+
+    @discord.ui.button(label="Prev", emoji="◀️", style=discord.ButtonStyle.secondary, row=1)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.category, max(self.start - PAGE_SIZE, 0))
+
+    @discord.ui.button(label="Next", emoji="▶️", style=discord.ButtonStyle.secondary, row=1)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.category, self.start + PAGE_SIZE)
+
+    @discord.ui.button(label="Jump to me", emoji="📍", style=discord.ButtonStyle.primary, row=1)
+    async def jump_to_me(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.prepare(self.category)
+        rank = await self.engine.rank(self.board_key(self.category), interaction.user.id)
+        if rank is None:
+            return await interaction.response.send_message(
+                embed=LilacEmbed.info("Not ranked yet", "You have no score on this leaderboard."),
+                ephemeral=True,
+            )
+        await self._show(interaction, self.category, (rank - 1) // PAGE_SIZE * PAGE_SIZE)
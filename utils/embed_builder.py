@@ -4,8 +4,11 @@ Provides a consistent, on-brand look for every message the bot sends.
 """
 from __future__ import annotations
 
+from datetime import datetime
+
 import discord
 from config import Colors
+from utils.leaderboard_engine import BoardView
 
 
 # ─────────────────────────────────────────────────────────────
@@ -69,18 +72,38 @@ CATEGORY_EMOJIS = {
     "monthly":    "📅",
     "autosummon": "🤖",
     "summon":     "🎴",
+    "24h":        "⏱️",
+    "7d":         "🗓️",
 }
 CATEGORY_LABELS = {
     "all":        "All Time",
     "monthly":    "Monthly",
     "autosummon": "AutoSummon",
     "summon":     "Summon",
+    "24h":        "Last 24h",
+    "7d":         "Last 7 Days",
 }
 
 
+def render_board_lines(
+    entries: list[tuple[str, int]],
+    start: int,
+    guild: discord.Guild,
+    unit: str = "claims",
+) -> list[tuple[str, str]]:
+    """Renders ranked entries into [(user_id, line)]; start is the 0-based rank offset."""
+    lines = []
+    for i, (uid, score) in enumerate(entries, start=start + 1):
+        member  = guild.get_member(int(uid))
+        mention = member.mention if member else f"<@{uid}>"
+        medal   = MEDALS.get(i, f"**`#{i:>2}`**")
+        lines.append((uid, f"{medal}  {mention} — **{score}** {unit}"))
+    return lines
+
+
 def build_leaderboard_embed(
     category: str,
-    sorted_data: list[tuple[str, str]],
+    board: BoardView,
     guild: discord.Guild,
     user: discord.Member,
 ) -> discord.Embed:
@@ -90,25 +113,18 @@ def build_leaderboard_embed(
     embed = LilacEmbed(title=f"{emoji}  {label} Leaderboard", color=Colors.GOLD)
     embed.set_guild_thumbnail(guild)
 
-    if not sorted_data:
+    if not board.lines:
         embed.description = "*No data yet — start claiming!*"
         embed.set_requester_footer(user)
         return embed
 
     user_id_str = str(user.id)
-    user_rank   = next((i for i, (uid, _) in enumerate(sorted_data, 1) if uid == user_id_str), None)
-    lines       = []
+    user_rank   = board.rank
+    embed.description = "\n".join(
+        f"{line} ◀" if uid == user_id_str else line for uid, line in board.lines
+    )
 
-    for i, (uid, score) in enumerate(sorted_data[:10], start=1):
-        member  = guild.get_member(int(uid))
-        mention = member.mention if member else f"<@{uid}>"
-        medal   = MEDALS.get(i, f"**`#{i:>2}`**")
-        hl      = " ◀" if uid == user_id_str else ""
-        lines.append(f"{medal}  {mention} — **{score}** claims{hl}")
-
-    embed.description = "\n".join(lines)
-
-    user_score = int(dict(sorted_data).get(user_id_str, 0))
+    user_score = board.score
     if user_rank and user_rank <= 3:
         rank_text = f"{MEDALS[user_rank]} You're on the podium!"
     elif user_rank and user_rank <= 10:
@@ -123,6 +139,47 @@ def build_leaderboard_embed(
     return embed
 
 
+def build_stats_embed(
+    user: discord.Member,
+    rows: list[tuple[str, str, int | None, int, str]],
+) -> discord.Embed:
+    """rows: [(emoji, label, rank, score, unit)] — one inline field per board."""
+    embed = LilacEmbed(title="📊  Your Stats", color=Colors.LILAC)
+    embed.set_author_member(user)
+    for emoji, label, rank, score, unit in rows:
+        place = f"#{rank}" if rank else "Unranked"
+        medal = MEDALS.get(rank, "") if rank else ""
+        embed.add_field(
+            name=f"{emoji} {label}",
+            value=f"{medal} **{place}** · {score} {unit}".strip(),
+            inline=True,
+        )
+    embed.set_requester_footer(user)
+    return embed
+
+
+def build_archive_embed(
+    month: str,
+    snapshot: dict,
+    guild: discord.Guild,
+    user: discord.Member,
+) -> discord.Embed:
+    """Renders a monthly archive snapshot: {"top": [[uid, score], ...], "players": n, "claims": n}."""
+    label = datetime.strptime(month, "%Y%m").strftime("%B %Y")
+    embed = LilacEmbed(title=f"🗄️  {label} Leaderboard", color=Colors.GOLD)
+    embed.set_guild_thumbnail(guild)
+
+    lines = render_board_lines([(uid, score) for uid, score in snapshot["top"]], 0, guild)
+    user_id_str = str(user.id)
+    embed.description = "\n".join(
+        f"{line} ◀" if uid == user_id_str else line for uid, line in lines
+    ) or "*Nobody claimed that month.*"
+    embed.add_field(name="Players", value=f"**{snapshot['players']}**", inline=True)
+    embed.add_field(name="Claims", value=f"**{snapshot['claims']}**", inline=True)
+    embed.set_requester_footer(user, extra="Archived")
+    return embed
+
+
 # ─────────────────────────────────────────────────────────────
 # Quick one-liner helpers
 # ─────────────────────────────────────────────────────────────
@@ -0,0 +1,218 @@
+"""
+utils/leaderboard_engine.py — Sorted-set leaderboards for Lilac Assistant
+Scores live in Redis ZSETs so ranking happens server-side. Every write also
+bumps a version counter ({key}:v), which lets rendered pages be cached in
+memory until the board actually changes: a repeat view is one pipelined
+round trip for the version and the caller's own rank/score.
+
+Usage:
+    engine = bot.leaderboard_engine   # built in main.py setup_hook
+    await engine.incr("lb:all", user.id)
+    view = await engine.view("lb:all", user.id, render)   # top 10 + caller stats
+"""
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+log = logging.getLogger("leaderboard-engine")
+
+PAGE_SIZE = 10
+RENDER_CACHE_SIZE = 64
+
+# render(entries, start) → [(user_id, line)]; start is the 0-based rank offset
+Renderer = Callable[[list[tuple[str, int]], int], list[tuple[str, str]]]
+
+
+def version_key(key: str) -> str:
+    """Counter bumped on every write to `key` (Lua scripts receive it in KEYS)."""
+    return f"{key}:v"
+
+
+@dataclass(slots=True)
+class BoardView:
+    lines: list[tuple[str, str]]     # [(user_id, rendered line)] for the requested range
+    start: int                       # 0-based rank offset of the first line
+    rank: int | None                 # caller's 1-based rank, None if unranked
+    score: int                       # caller's score
+    total: int                       # members on the board
+
+
+class LeaderboardEngine:
+    def __init__(self, bot):
+        self.bot = bot
+        # (key, start, count) → (version, rendered lines)
+        self._rendered: OrderedDict[tuple[str, int, int], tuple[str, list[tuple[str, str]]]] = OrderedDict()
+
+    @property
+    def redis(self):
+        return getattr(self.bot, "redis", None)
+
+    # ─────────────────────────────────────────────
+    # Writes
+    # ─────────────────────────────────────────────
+
+    async def incr(self, key: str, user_id: int | str, amount: int = 1):
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zincrby(key, amount, str(user_id))
+        pipe.incr(version_key(key))
+        await pipe.execute()
+
+    async def apply_increments(
+        self,
+        increments: dict[tuple[str, str], int],
+        expire_at: dict[str, int] | None = None,
+    ):
+        """
+        Applies {(key, user_id): amount} in one pipeline — the WriteBuffer flush
+        target. Keys listed in expire_at (time-bucketed boards) get an EXPIREAT.
+        """
+        expire_at = expire_at or {}
+        pipe = self.redis.pipeline(transaction=True)
+        for (key, user_id), amount in increments.items():
+            pipe.zincrby(key, amount, str(user_id))
+        for key in {key for key, _ in increments}:
+            pipe.incr(version_key(key))
+            if key in expire_at:
+                pipe.expireat(key, expire_at[key])
+                pipe.expireat(version_key(key), expire_at[key])
+        await pipe.execute()
+
+    async def set_expiry(self, key: str, when: int):
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.expireat(key, when)
+        pipe.expireat(version_key(key), when)
+        await pipe.execute()
+
+    async def ensure_union(self, key: str, sources: list[str], expire_at: int):
+        """
+        Builds `key` as the sum of `sources` unless it already exists. Safe to
+        race with writers that increment `key` and a source together: the
+        union is a pure function of the sources, so a rebuild loses nothing.
+        """
+        if await self.redis.exists(key):
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zunionstore(key, sources, aggregate="SUM")
+        pipe.expireat(key, expire_at)
+        pipe.incr(version_key(key))
+        pipe.expireat(version_key(key), expire_at)
+        await pipe.execute()
+
+    async def reset(self, *keys: str):
+        if not keys:
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(*keys)
+        for key in keys:
+            pipe.incr(version_key(key))
+        await pipe.execute()
+
+    # ─────────────────────────────────────────────
+    # Reads
+    # ─────────────────────────────────────────────
+
+    async def view(
+        self,
+        key: str,
+        user_id: int | str,
+        render: Renderer,
+        start: int = 0,
+        count: int = PAGE_SIZE,
+    ) -> BoardView:
+        """
+        Caller stats are always read fresh; the rendered page is reused while
+        the board's version is unchanged and only re-fetched after a write.
+        """
+        uid  = str(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(version_key(key))
+        pipe.zrevrank(key, uid)
+        pipe.zscore(key, uid)
+        pipe.zcard(key)
+        version, rank, score, total = await pipe.execute()
+        version = version or "0"
+        if start and start >= total:
+            start = max((total - 1) // count * count, 0)
+
+        cache_key = (key, start, count)
+        cached = self._rendered.get(cache_key)
+        if cached and cached[0] == version:
+            self._rendered.move_to_end(cache_key)
+            lines = cached[1]
+        else:
+            entries = await self.redis.zrevrange(key, start, start + count - 1, withscores=True)
+            lines   = render([(member, int(s)) for member, s in entries], start)
+            self._rendered[cache_key] = (version, lines)
+            self._rendered.move_to_end(cache_key)
+            while len(self._rendered) > RENDER_CACHE_SIZE:
+                self._rendered.popitem(last=False)
+
+        return BoardView(
+            lines=lines,
+            start=start,
+            rank=rank + 1 if rank is not None else None,
+            score=int(score or 0),
+            total=total,
+        )
+
+    async def rank(self, key: str, user_id: int | str) -> int | None:
+        """Caller's 1-based rank, or None when they have no score."""
+        rank = await self.redis.zrevrank(key, str(user_id))
+        return rank + 1 if rank is not None else None
+
+    async def stats(self, keys: list[str], user_id: int | str) -> list[tuple[int | None, int]]:
+        """Caller's (1-based rank, score) on each board, read in one round trip."""
+        uid  = str(user_id)
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.zrevrank(key, uid)
+            pipe.zscore(key, uid)
+        results = await pipe.execute()
+        return [
+            (rank + 1 if rank is not None else None, int(score or 0))
+            for rank, score in zip(results[0::2], results[1::2])
+        ]
+
+    async def size(self, key: str) -> int:
+        return await self.redis.zcard(key)
+
+    # ─────────────────────────────────────────────
+    # Migration from legacy layouts
+    # ─────────────────────────────────────────────
+
+    async def migrate_board(self, source_key: str, zset_key: str, batch_size: int = 1000) -> int:
+        """
+        Folds a legacy board into `zset_key` (scores are summed with anything
+        already recorded) and deletes the source. The source may be a legacy
+        HINCRBY hash or a sorted set under an old name. Returns members moved.
+        """
+        kind = await self.redis.type(source_key)
+        if kind == "zset":
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.zcard(source_key)
+            pipe.zunionstore(zset_key, [zset_key, source_key], aggregate="SUM")
+            pipe.delete(source_key, version_key(source_key))
+            pipe.incr(version_key(zset_key))
+            moved = (await pipe.execute())[0]
+        elif kind == "hash":
+            data    = await self.redis.hgetall(source_key)
+            staging = f"{zset_key}:migrating"
+            items   = [(uid, int(score)) for uid, score in data.items()]
+
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.delete(staging)
+            for i in range(0, len(items), batch_size):
+                pipe.zadd(staging, dict(items[i:i + batch_size]))
+            pipe.zunionstore(zset_key, [zset_key, staging], aggregate="SUM")
+            pipe.delete(staging, source_key)
+            pipe.incr(version_key(zset_key))
+            await pipe.execute()
+            moved = len(items)
+        else:
+            return 0
+
+        log.info("🔁 Migrated %s entries from %s to %s", moved, source_key, zset_key)
+        return moved
@@ -0,0 +1,132 @@
+"""
+utils/leaderboard_keys.py — Redis key naming for time-bucketed leaderboards
+Daily and monthly boards are written to date-stamped keys (UTC) that carry
+an EXPIREAT, so a new period simply starts a new key: no reset job, no
+missed midnight, and past periods stay readable until they expire.
+
+Rolling windows (last 24h / last 7 days) are kept as one live sorted set per
+window and period: it is rebuilt with a single ZUNIONSTORE over the window's
+buckets the first time it is touched in a new period, and every claim after
+that increments it alongside the current bucket. Reads never union.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+# ─────────────────────────────────────────────
+# NAI boards
+# ─────────────────────────────────────────────
+
+NAI_ALL_KEY        = "lb:nai:all"
+NAI_DAILY_PREFIX   = "lb:nai:daily"
+NAI_MONTHLY_PREFIX = "lb:nai:monthly"
+
+DAILY_RETENTION_DAYS     = 7   # past days stay queryable this long
+MONTHLY_RETENTION_MONTHS = 3
+
+
+# ─────────────────────────────────────────────
+# Time helpers (UTC)
+# ─────────────────────────────────────────────
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def start_of_day(when: datetime) -> datetime:
+    return when.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def start_of_month(when: datetime) -> datetime:
+    return start_of_day(when).replace(day=1)
+
+
+def add_months(when: datetime, months: int) -> datetime:
+    """First day of the month `months` away from `when` (negative goes back)."""
+    index = when.year * 12 + when.month - 1 + months
+    return start_of_month(when).replace(year=index // 12, month=index % 12 + 1)
+
+
+# ─────────────────────────────────────────────
+# Bucket keys
+# ─────────────────────────────────────────────
+
+def day_key(prefix: str, when: datetime) -> str:
+    return f"{prefix}:{when:%Y%m%d}"
+
+
+def month_key(prefix: str, when: datetime) -> str:
+    return f"{prefix}:{when:%Y%m}"
+
+
+def day_expire_at(when: datetime, retention_days: int = DAILY_RETENTION_DAYS) -> int:
+    """Unix time at which the day bucket containing `when` should expire."""
+    return int((start_of_day(when) + timedelta(days=1 + retention_days)).timestamp())
+
+
+def next_month_at(when: datetime) -> float:
+    """Unix time of the next UTC month boundary after `when`."""
+    return add_months(when, 1).timestamp()
+
+
+def month_expire_at(when: datetime, retention_months: int = MONTHLY_RETENTION_MONTHS) -> int:
+    """Unix time at which the month bucket containing `when` should expire."""
+    return int(add_months(when, 1 + retention_months).timestamp())
+
+
+def nai_board_key(category: str, now: datetime | None = None) -> str:
+    """Sorted-set key for a NAI category: all, daily, yesterday, monthly, last_month."""
+    now = now or utc_now()
+    if category == "all":
+        return NAI_ALL_KEY
+    if category == "daily":
+        return day_key(NAI_DAILY_PREFIX, now)
+    if category == "yesterday":
+        return day_key(NAI_DAILY_PREFIX, now - timedelta(days=1))
+    if category == "monthly":
+        return month_key(NAI_MONTHLY_PREFIX, now)
+    if category == "last_month":
+        return month_key(NAI_MONTHLY_PREFIX, add_months(now, -1))
+    raise KeyError(category)
+
+
+# ─────────────────────────────────────────────
+# Rolling windows
+# ─────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class RollingWindow:
+    name: str          # category name, also used in the live window key
+    prefix: str        # bucket key prefix
+    step: timedelta    # bucket length
+    span: int          # buckets covered by the window, current one included
+    fmt: str           # strftime pattern for bucket / window suffixes
+
+    def period_start(self, when: datetime) -> datetime:
+        step = self.step.total_seconds()
+        return datetime.fromtimestamp(when.timestamp() // step * step, timezone.utc)
+
+    def bucket_key(self, when: datetime) -> str:
+        return f"{self.prefix}:{self.period_start(when):{self.fmt}}"
+
+    def bucket_keys(self, when: datetime) -> list[str]:
+        """Every bucket inside the window ending at `when`, newest first."""
+        start = self.period_start(when)
+        return [f"{self.prefix}:{start - self.step * i:{self.fmt}}" for i in range(self.span)]
+
+    def window_key(self, when: datetime) -> str:
+        return f"lb:window:{self.name}:{self.period_start(when):{self.fmt}}"
+
+    def bucket_expire_at(self, when: datetime) -> int:
+        """A bucket is needed until the last window containing it is rebuilt."""
+        return int((self.period_start(when) + self.step * (self.span + 1)).timestamp())
+
+    def window_expire_at(self, when: datetime) -> int:
+        return int((self.period_start(when) + self.step * 2).timestamp())
+
+
+WINDOWS = {
+    "24h": RollingWindow("24h", "lb:hour", timedelta(hours=1), 24, "%Y%m%d%H"),
+    "7d":  RollingWindow("7d",  "lb:day",  timedelta(days=1),  7,  "%Y%m%d"),
+}
@@ -0,0 +1,157 @@
+"""
+utils/mazoku_events.py — Typed events parsed from Mazoku embed edits
+Each edited Mazoku message is classified once by classify() and the
+resulting events are fanned out by MazokuRouter to subscribed handlers.
+
+Usage:
+    router = bot.mazoku_router   # built in main.py setup_hook
+    router.subscribe(SummonClaimed, self.on_summon_claimed)   # async def handler(event)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import discord
+
+from config import RARITY_EMOJIS, RARITY_PRIORITY
+
+log = logging.getLogger("mazoku-events")
+
+MENTION_REGEX = re.compile(r"<@!?(\d+)>")
+EMOJI_REGEX   = re.compile(r"<a?:[^:]+:(\d+)>")
+LNY_REGEX     = re.compile(r"<@!?(\d+)>\s+sent a\s+<:[^:]+:\d+>\s+red packet to\s+<@!?(\d+)>")
+
+
+# ─────────────────────────────────────────────
+# Events
+# ─────────────────────────────────────────────
+
+@dataclass(frozen=True, slots=True)
+class MazokuEdit:
+    """Raised for every Mazoku edit that carries an embed."""
+    message: discord.Message
+    embed: discord.Embed
+
+
+@dataclass(frozen=True, slots=True)
+class SummonClaimed:
+    """A manual /summon was claimed (auto summons excluded)."""
+    message: discord.Message
+    user_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class AutoSummon:
+    """An auto summon embed containing an SR / SSR / UR card."""
+    message: discord.Message
+    rarity: str
+
+
+@dataclass(frozen=True, slots=True)
+class ClanCast:
+    """A clan summon spell was cast; caster is the display name in the footer."""
+    message: discord.Message
+    caster: str
+
+
+@dataclass(frozen=True, slots=True)
+class LnyPacket:
+    """A Lunar New Year red packet was sent."""
+    message: discord.Message
+    sender_id: int
+    recipient_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class CardClaimed:
+    """Any card claim that counts towards the leaderboard."""
+    message: discord.Message
+    user_id: int
+    auto: bool
+
+
+# ─────────────────────────────────────────────
+# Classification
+# ─────────────────────────────────────────────
+
+def _highest_rarity(text: str) -> str | None:
+    found, highest = None, 0
+    for emoji_id in EMOJI_REGEX.findall(text):
+        rarity = RARITY_EMOJIS.get(emoji_id)
+        if rarity and RARITY_PRIORITY[rarity] > highest:
+            found, highest = rarity, RARITY_PRIORITY[rarity]
+    return found
+
+
+def classify(message: discord.Message) -> list:
+    """Parses the first embed of a Mazoku message into zero or more events."""
+    embed  = message.embeds[0]
+    title  = (embed.title or "").lower()
+    desc   = embed.description or ""
+    footer = embed.footer.text if embed.footer and embed.footer.text else ""
+
+    events: list = [MazokuEdit(message, embed)]
+    desc_mention = MENTION_REGEX.search(desc)
+
+    if "summon claimed" in title and "auto summon claimed" not in title:
+        footer_lower = footer.lower()
+        match = desc_mention or (
+            MENTION_REGEX.search(footer_lower) if "claimed by" in footer_lower else None
+        )
+        if match:
+            events.append(SummonClaimed(message, int(match.group(1))))
+
+    if any(x in title for x in ("card claimed", "auto summon claimed", "summon claimed")) and desc_mention:
+        events.append(CardClaimed(message, int(desc_mention.group(1)), "auto summon claimed" in title))
+
+    if "auto summon" in title:
+        rarity = _highest_rarity(desc)
+        if rarity:
+            events.append(AutoSummon(message, rarity))
+
+    if "casting for round" in title and footer:
+        events.append(ClanCast(message, footer))
+
+    lny = LNY_REGEX.search(desc)
+    if lny:
+        events.append(LnyPacket(message, int(lny.group(1)), int(lny.group(2))))
+
+    return events
+
+
+# ─────────────────────────────────────────────
+# Router
+# ─────────────────────────────────────────────
+
+Handler = Callable[[object], Awaitable[None]]
+
+
+class MazokuRouter:
+    def __init__(self):
+        self._handlers: dict[type, list[Handler]] = {}
+
+    def subscribe(self, event_type: type, handler: Handler):
+        handlers = self._handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unsubscribe(self, event_type: type, handler: Handler):
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def dispatch(self, message: discord.Message):
+        calls = [
+            handler(event)
+            for event in classify(message)
+            for handler in self._handlers.get(type(event), ())
+        ]
+        if not calls:
+            return
+        for result in await asyncio.gather(*calls, return_exceptions=True):
+            if isinstance(result, Exception):
+                log.error("❌ Mazoku event handler failed", exc_info=result)
@@ -0,0 +1,90 @@
+"""
+utils/pubsub.py — Shared Redis pub/sub listener
+One background subscription serves every cog; handlers are registered per
+channel and called with the raw message payload.
+
+Usage:
+    pubsub = bot.pubsub   # built in main.py setup_hook
+    pubsub.subscribe("reminder:settings:invalidate", self._on_invalidate)   # async def handler(data)
+    pubsub.on_reconnect(self.clear)   # called after the subscription was re-established
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+log = logging.getLogger("pubsub")
+
+Handler = Callable[[str], Awaitable[None]]
+
+
+class PubSubListener:
+    def __init__(self, bot):
+        self.bot = bot
+        self._handlers: dict[str, list[Handler]] = {}
+        self._reconnect_hooks: list[Callable[[], None]] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, channel: str, handler: Handler):
+        handlers = self._handlers.setdefault(channel, [])
+        if handler not in handlers:
+            handlers.append(handler)
+        self._restart()
+
+    def unsubscribe(self, channel: str, handler: Handler):
+        handlers = self._handlers.get(channel, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self._handlers.pop(channel, None)
+        self._restart()
+
+    def on_reconnect(self, hook: Callable[[], None]):
+        if hook not in self._reconnect_hooks:
+            self._reconnect_hooks.append(hook)
+
+    async def publish(self, channel: str, data: str):
+        if getattr(self.bot, "redis", None):
+            await self.bot.redis.publish(channel, data)
+
+    # ─────────────────────────────────────────────
+    # Listener task
+    # ─────────────────────────────────────────────
+
+    def _restart(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._handlers and getattr(self.bot, "redis", None):
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        first = True
+        while True:
+            pubsub = self.bot.redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(*self._handlers)
+                if not first:
+                    # Messages may have been missed while disconnected
+                    for hook in self._reconnect_hooks:
+                        hook()
+                first = False
+                async for message in pubsub.listen():
+                    for handler in list(self._handlers.get(message["channel"], ())):
+                        try:
+                            await handler(message["data"])
+                        except Exception:
+                            log.exception("❌ Pub/sub handler failed on %s", message["channel"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("⚠️ Pub/sub connection lost (%s), retrying in 5s", e)
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
@@ -0,0 +1,86 @@
+"""
+utils/rate_queue.py — Coalescing, rate-limited work queue
+Work is keyed (e.g. by member id): putting a key that is already queued
+replaces its payload instead of adding a second job, so bursts collapse to
+one call per key. A single worker drains the queue in FIFO order, spacing
+calls at least `interval` seconds apart and backing off on 429s, so one
+busy source cannot monopolise a Discord rate-limit bucket.
+
+Usage:
+    queue = RateLimitedQueue(self._remove_t3, name="luvi", interval=1.0)
+    queue.put(member.id, member)        # async def handler(key, payload)
+    queue.close()                       # on unload
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+import discord
+
+log = logging.getLogger("rate-queue")
+
+Handler = Callable[[Hashable, Any], Awaitable[None]]
+
+
+class RateLimitedQueue:
+    def __init__(self, handler: Handler, *, name: str, interval: float):
+        self._handler = handler
+        self.name     = name
+        self.interval = interval
+
+        self._pending: OrderedDict[Hashable, Any] = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def put(self, key: Hashable, payload: Any = None):
+        """Queues key, or replaces the payload of an already queued key in place."""
+        self._pending[key] = payload
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._pending.get(key, default)
+
+    def discard(self, key: Hashable):
+        self._pending.pop(key, None)
+
+    def close(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            key, payload = self._pending.popitem(last=False)
+            started = loop.time()
+            try:
+                await self._handler(key, payload)
+            except discord.HTTPException as e:
+                if e.status != 429:
+                    log.error("❌ %s queue: %s failed: %s", self.name, key, e)
+                else:
+                    retry_after = float(e.response.headers.get("Retry-After", 1))
+                    log.warning("⏳ %s queue rate limited, retrying %s in %.1fs", self.name, key, retry_after)
+                    if key not in self._pending:
+                        self._pending[key] = payload
+                        self._pending.move_to_end(key, last=False)
+                    await asyncio.sleep(retry_after)
+            except Exception:
+                log.exception("❌ %s queue handler failed for %s", self.name, key)
+            await asyncio.sleep(max(0.0, self.interval - (loop.time() - started)))
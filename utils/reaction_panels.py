@@ -0,0 +1,164 @@
+"""
+utils/reaction_panels.py — Reaction-role panels stored in Redis
+Every panel maps one message to emoji → role bindings, with optional gates
+(role → required roles, any one of which unlocks it). Panels are loaded
+into a dict once and kept current over pub/sub, so a reaction resolves with
+one dict lookup and a new panel goes live without a redeploy. The boss-ping
+panel from config.py is always present, so it keeps working without Redis.
+
+Layout:
+    rr:panels            HASH  message_id → JSON panel
+    rr:panels:changed    pub/sub channel, payload = message_id that changed
+
+Usage:
+    panels = bot.reaction_panels   # built in main.py setup_hook
+    panel = panels.get(payload.message_id)          # None if not a panel
+    role_id = panel.roles.get(str(payload.emoji))
+    await panels.save(panel)                         # writes + broadcasts reload
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+
+from config import (
+    AUTOROLE_MESSAGE_ID, TARGET_CHANNEL_ID,
+    ROLE_TIER_1, ROLE_TIER_2, ROLE_TIER_3, REQUIRED_ROLES_FOR_T3,
+)
+
+log = logging.getLogger("reaction-panels")
+
+PANELS_KEY      = "rr:panels"
+CHANGED_CHANNEL = "rr:panels:changed"
+
+DEFAULT_GATE_MESSAGE = "You don't meet the requirements for this role yet."
+
+
+@dataclass(slots=True)
+class Panel:
+    message_id: int
+    channel_id: int
+    roles: dict[str, int] = field(default_factory=dict)              # emoji → role id
+    gates: dict[int, frozenset[int]] = field(default_factory=dict)   # role id → required role ids
+    gate_message: str = DEFAULT_GATE_MESSAGE
+
+    def dumps(self) -> str:
+        return json.dumps({
+            "channel_id":   self.channel_id,
+            "roles":        self.roles,
+            "gates":        {str(r): sorted(req) for r, req in self.gates.items()},
+            "gate_message": self.gate_message,
+        })
+
+    @classmethod
+    def loads(cls, message_id: int, raw: str) -> "Panel":
+        data = json.loads(raw)
+        return cls(
+            message_id=message_id,
+            channel_id=int(data["channel_id"]),
+            roles={emoji: int(role) for emoji, role in data.get("roles", {}).items()},
+            gates={int(r): frozenset(map(int, req)) for r, req in data.get("gates", {}).items()},
+            gate_message=data.get("gate_message", DEFAULT_GATE_MESSAGE),
+        )
+
+
+def default_panel() -> Panel:
+    """The boss-ping panel that used to be hard-wired in config.py."""
+    return Panel(
+        message_id=AUTOROLE_MESSAGE_ID,
+        channel_id=TARGET_CHANNEL_ID,
+        roles={"1️⃣": ROLE_TIER_1, "2️⃣": ROLE_TIER_2, "3️⃣": ROLE_TIER_3},
+        gates={ROLE_TIER_3: frozenset(REQUIRED_ROLES_FOR_T3)},
+        gate_message="Keep grinding or join our clan to unlock Tier 3 notifications! 💪",
+    )
+
+
+class PanelStore:
+    def __init__(self, bot):
+        self.bot = bot
+        self.panels: dict[int, Panel] = self._defaults()
+
+        self.pubsub = bot.pubsub
+        self.pubsub.subscribe(CHANGED_CHANNEL, self._on_changed)
+        self.pubsub.on_reconnect(lambda: asyncio.create_task(self.load_all()))
+
+    def get(self, message_id: int) -> Panel | None:
+        return self.panels.get(message_id)
+
+    @staticmethod
+    def _defaults() -> dict[int, Panel]:
+        panel = default_panel()
+        return {panel.message_id: panel} if panel.message_id else {}
+
+    async def load_all(self):
+        """
+        Loads every panel from Redis on top of the config-defined default, so
+        the boss-ping panel keeps working when Redis is down or unreadable.
+        """
+        panels = self._defaults()
+        if not getattr(self.bot, "redis", None):
+            self.panels = panels
+            log.warning("⚠️ Redis unavailable, using the default reaction panel only")
+            return
+        try:
+            raw = await self.bot.redis.hgetall(PANELS_KEY)
+        except Exception as e:
+            self.panels = panels
+            log.warning("⚠️ Could not load reaction panels (%s), using the default panel only", e)
+            return
+        for message_id, data in raw.items():
+            try:
+                panels[int(message_id)] = Panel.loads(int(message_id), data)
+            except (ValueError, KeyError, TypeError):
+                log.warning("⚠️ Skipping malformed reaction panel %s", message_id)
+        self.panels = panels
+        log.info("🧷 Loaded %s reaction-role panel(s)", len(panels))
+
+    async def seed_default(self):
+        """Stores the config-defined panel unless one already exists for that message."""
+        panel = default_panel()
+        if not getattr(self.bot, "redis", None) or not panel.message_id:
+            return
+        try:
+            await self.bot.redis.hsetnx(PANELS_KEY, str(panel.message_id), panel.dumps())
+        except Exception as e:
+            log.warning("⚠️ Could not seed the default reaction panel (%s)", e)
+
+    async def save(self, panel: Panel):
+        pipe = self.bot.redis.pipeline(transaction=False)
+        pipe.hset(PANELS_KEY, str(panel.message_id), panel.dumps())
+        pipe.publish(CHANGED_CHANNEL, str(panel.message_id))
+        await pipe.execute()
+        self.panels[panel.message_id] = panel
+
+    async def delete(self, message_id: int):
+        pipe = self.bot.redis.pipeline(transaction=False)
+        pipe.hdel(PANELS_KEY, str(message_id))
+        pipe.publish(CHANGED_CHANNEL, str(message_id))
+        await pipe.execute()
+        self._forget(message_id)
+
+    def _forget(self, message_id: int):
+        """Drops a panel from memory; the config default falls back into place."""
+        default = self._defaults().get(message_id)
+        if default:
+            self.panels[message_id] = default
+        else:
+            self.panels.pop(message_id, None)
+
+    async def _on_changed(self, data: str):
+        try:
+            message_id = int(data)
+        except ValueError:
+            log.warning("⚠️ Malformed panel change notice: %r", data)
+            return
+        raw = await self.bot.redis.hget(PANELS_KEY, data)
+        if raw is None:
+            self._forget(message_id)
+            return
+        try:
+            self.panels[message_id] = Panel.loads(message_id, raw)
+        except (ValueError, KeyError, TypeError):
+            log.warning("⚠️ Ignoring malformed reaction panel %s", message_id)
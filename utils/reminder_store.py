@@ -0,0 +1,73 @@
+"""
+utils/reminder_store.py — Persistent due queue for reminders
+Each reminder kind keeps one sorted set scored by expire_at and one hash
+of payloads, so a restart is a range query instead of a KEYS scan.
+
+Layout:
+    reminder:due:{kind}       ZSET  user_id → expire_at
+    reminder:payload:{kind}   HASH  user_id → channel_id
+"""
+from __future__ import annotations
+
+import time
+
+
+class ReminderStore:
+    def __init__(self, bot, kind: str):
+        self.bot         = bot
+        self.kind        = kind
+        self.due_key     = f"reminder:due:{kind}"
+        self.payload_key = f"reminder:payload:{kind}"
+
+    @property
+    def redis(self):
+        return getattr(self.bot, "redis", None)
+
+    async def add(self, user_id: int, expire_at: int, channel_id: int):
+        if not self.redis:
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zadd(self.due_key, {user_id: expire_at})
+        pipe.hset(self.payload_key, user_id, channel_id)
+        await pipe.execute()
+
+    async def remove(self, user_id: int):
+        if not self.redis:
+            return
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.zrem(self.due_key, user_id)
+        pipe.hdel(self.payload_key, user_id)
+        await pipe.execute()
+
+    async def load_pending(self) -> list[tuple[int, int, int]]:
+        """
+        Returns [(user_id, expire_at, channel_id)] for every reminder still due
+        and drops the expired ones — two round trips regardless of queue size.
+        """
+        if not self.redis:
+            return []
+        now = int(time.time())
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zrangebyscore(self.due_key, f"({now}", "+inf", withscores=True)
+        pipe.zrangebyscore(self.due_key, "-inf", now)
+        pending, expired = await pipe.execute()
+
+        pipe = self.redis.pipeline(transaction=True)
+        if pending:
+            pipe.hmget(self.payload_key, [uid for uid, _ in pending])
+        if expired:
+            pipe.zremrangebyscore(self.due_key, "-inf", now)
+            pipe.hdel(self.payload_key, *expired)
+        if not pending and not expired:
+            return []
+        results = await pipe.execute()
+
+        if not pending:
+            return []
+        out = []
+        for (uid, score), channel_id in zip(pending, results[0]):
+            if channel_id is None:
+                continue
+            out.append((int(uid), int(score), int(channel_id)))
+        return out
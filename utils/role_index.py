@@ -0,0 +1,103 @@
+"""
+utils/role_index.py — In-memory role → member-id index
+Built once per guild from the member cache and kept current by the
+RoleIndexListener cog (cogs/role_index.py), so role queries like "Tier 3
+without any required role" are set operations instead of a walk over
+guild.members with a list scan of member.roles for each one.
+
+Usage:
+    index = bot.role_index   # built in main.py setup_hook
+    t3 = index.members(guild, ROLE_TIER_3)                       # set of member ids
+    stale = index.members(guild, ROLE_TIER_3) - index.union(guild, REQUIRED_ROLES_FOR_T3)
+"""
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from typing import Iterable
+
+import discord
+
+log = logging.getLogger("role-index")
+
+_EMPTY: frozenset[int] = frozenset()
+
+
+class RoleIndex:
+    def __init__(self):
+        # guild_id → role_id → member ids
+        self._by_role: dict[int, defaultdict[int, set[int]]] = {}
+        # guild_id → member_id → role ids, to diff updates
+        self._by_member: dict[int, dict[int, frozenset[int]]] = {}
+
+    # ─────────────────────────────────────────────
+    # Maintenance
+    # ─────────────────────────────────────────────
+
+    def build(self, guild: discord.Guild):
+        by_role: defaultdict[int, set[int]] = defaultdict(set)
+        by_member: dict[int, frozenset[int]] = {}
+        for member in guild.members:
+            roles = frozenset(r.id for r in member.roles)
+            by_member[member.id] = roles
+            for role_id in roles:
+                by_role[role_id].add(member.id)
+        self._by_role[guild.id], self._by_member[guild.id] = by_role, by_member
+        log.info("🗂️ Role index built for %s (%s members, %s roles)", guild.name, len(by_member), len(by_role))
+
+    def is_built(self, guild_id: int) -> bool:
+        return guild_id in self._by_role
+
+    def update_member(self, member: discord.Member):
+        guild_id = member.guild.id
+        if not self.is_built(guild_id):
+            return
+        new = frozenset(r.id for r in member.roles)
+        old = self._by_member[guild_id].get(member.id, _EMPTY)
+        if new == old:
+            return
+        by_role = self._by_role[guild_id]
+        for role_id in old - new:
+            by_role[role_id].discard(member.id)
+        for role_id in new - old:
+            by_role[role_id].add(member.id)
+        self._by_member[guild_id][member.id] = new
+
+    def remove_member(self, guild_id: int, member_id: int):
+        if not self.is_built(guild_id):
+            return
+        by_role = self._by_role[guild_id]
+        for role_id in self._by_member[guild_id].pop(member_id, _EMPTY):
+            by_role[role_id].discard(member_id)
+
+    def remove_role(self, guild_id: int, role_id: int):
+        if not self.is_built(guild_id):
+            return
+        by_member = self._by_member[guild_id]
+        for member_id in self._by_role[guild_id].pop(role_id, ()):
+            by_member[member_id] = by_member[member_id] - {role_id}
+
+    def forget_guild(self, guild_id: int):
+        self._by_role.pop(guild_id, None)
+        self._by_member.pop(guild_id, None)
+
+    # ─────────────────────────────────────────────
+    # Queries (built lazily on first use)
+    # ─────────────────────────────────────────────
+
+    def _roles(self, guild: discord.Guild) -> defaultdict[int, set[int]]:
+        if not self.is_built(guild.id):
+            self.build(guild)
+        return self._by_role[guild.id]
+
+    def members(self, guild: discord.Guild, role_id: int) -> frozenset[int]:
+        """Ids of members holding role_id (a snapshot, safe to keep)."""
+        return frozenset(self._roles(guild).get(role_id, _EMPTY))
+
+    def union(self, guild: discord.Guild, role_ids: Iterable[int]) -> set[int]:
+        """Ids of members holding at least one of role_ids."""
+        roles = self._roles(guild)
+        return set().union(*(roles.get(r, _EMPTY) for r in role_ids))
+
+    def has_role(self, guild_id: int, member_id: int, role_id: int) -> bool:
+        return role_id in self._by_member.get(guild_id, {}).get(member_id, _EMPTY)
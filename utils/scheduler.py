@@ -0,0 +1,148 @@
+"""
+utils/scheduler.py — Shared due-time scheduler for Lilac Assistant
+One min-heap of due times and one dispatcher coroutine serve every cog,
+instead of one sleeping asyncio.Task per pending reminder.
+
+Usage:
+    scheduler = bot.scheduler   # built in main.py setup_hook
+    scheduler.register("summon", self._fire_summon)   # async def handler(user_id, payload)
+    scheduler.schedule("summon", member.id, time.time() + 1800, channel)
+    scheduler.cancel("summon", member.id)
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+log = logging.getLogger("scheduler")
+
+Handler = Callable[[int, Any], Awaitable[None]]
+
+# Heap entry layout: [due_at, seq, kind, entry_id, payload]
+# A cancelled entry keeps its slot in the heap with kind set to None
+# and is discarded when it reaches the top (lazy deletion).
+_DUE, _SEQ, _KIND, _ID, _PAYLOAD = range(5)
+
+
+class Scheduler:
+    """
+    Min-heap of (due_at, kind, id) with a single dispatcher task.
+    schedule() and cancel() are O(log n) / O(1); the dispatcher only ever
+    sleeps until the earliest due time.
+    """
+
+    def __init__(self):
+        self._heap: list[list] = []
+        self._entries: dict[tuple[str, int], list] = {}
+        self._handlers: dict[str, Handler] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    # ─────────────────────────────────────────────
+    # Registration
+    # ─────────────────────────────────────────────
+
+    def register(self, kind: str, handler: Handler):
+        self._handlers[kind] = handler
+
+    def unregister(self, kind: str):
+        """Drops the handler and every pending entry of that kind."""
+        self._handlers.pop(kind, None)
+        for key in [k for k in self._entries if k[0] == kind]:
+            self.cancel(*key)
+
+    # ─────────────────────────────────────────────
+    # Entries
+    # ─────────────────────────────────────────────
+
+    def schedule(self, kind: str, entry_id: int, due_at: float, payload: Any = None) -> bool:
+        """Returns False if an entry for (kind, entry_id) is already pending."""
+        key = (kind, entry_id)
+        if key in self._entries:
+            return False
+
+        entry = [due_at, next(self._counter), kind, entry_id, payload]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        self.start()
+        return True
+
+    def cancel(self, kind: str, entry_id: int) -> bool:
+        entry = self._entries.pop((kind, entry_id), None)
+        if entry is None:
+            return False
+        entry[_KIND] = None
+        entry[_PAYLOAD] = None
+        return True
+
+    def is_scheduled(self, kind: str, entry_id: int) -> bool:
+        return (kind, entry_id) in self._entries
+
+    def due_at(self, kind: str, entry_id: int) -> float | None:
+        entry = self._entries.get((kind, entry_id))
+        return entry[_DUE] if entry else None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ─────────────────────────────────────────────
+    # Dispatcher
+    # ─────────────────────────────────────────────
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        """Cancels the dispatcher and any handler still running (bot shutdown)."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in list(self._inflight):
+            task.cancel()
+
+    async def _run(self):
+        while True:
+            # Drop cancelled entries sitting on top of the heap
+            while self._heap and self._heap[0][_KIND] is None:
+                heapq.heappop(self._heap)
+
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][_DUE] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            entry = heapq.heappop(self._heap)
+            kind, entry_id, payload = entry[_KIND], entry[_ID], entry[_PAYLOAD]
+            self._entries.pop((kind, entry_id), None)
+
+            handler = self._handlers.get(kind)
+            if handler is None:
+                log.warning("⚠️ No handler registered for %s entry %s", kind, entry_id)
+                continue
+            task = asyncio.create_task(self._dispatch(handler, kind, entry_id, payload))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, handler: Handler, kind: str, entry_id: int, payload: Any):
+        try:
+            await handler(entry_id, payload)
+        except Exception:
+            log.exception("❌ %s handler failed for %s", kind, entry_id)
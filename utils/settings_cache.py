@@ -0,0 +1,166 @@
+"""
+utils/settings_cache.py — In-memory cache for per-user reminder settings
+Settings are loaded lazily per (guild, user), kept in a bounded LRU and
+invalidated over Redis pub/sub whenever /reminders changes them, so the
+claim path reads settings without touching Redis.
+
+Layout:
+    reminder:settings:{guild}:{user}   HASH  summon / premium / clan → "0" | "1"
+
+Usage:
+    settings = bot.settings_cache   # built in main.py setup_hook
+    if await settings.get(guild_id, user_id, "premium") == "1": ...
+    await settings.set(guild_id, user_id, "premium", "1")   # writes + broadcasts invalidation
+"""
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+
+from config import SETTINGS_CACHE_SIZE
+
+log = logging.getLogger("settings-cache")
+
+SETTINGS = ("summon", "premium", "clan")
+INVALIDATE_CHANNEL = "reminder:settings:invalidate"
+
+
+def settings_key(guild_id: int, user_id: int) -> str:
+    return f"reminder:settings:{guild_id}:{user_id}"
+
+
+class SettingsCache:
+    def __init__(self, bot, max_size: int = SETTINGS_CACHE_SIZE):
+        self.bot      = bot
+        self.max_size = max_size
+        self._data: OrderedDict[tuple[int, int], dict[str, str | None]] = OrderedDict()
+        # Bumped on every invalidation so a load that raced with one is not cached
+        self._epoch = 0
+
+        self.pubsub = bot.pubsub
+        self.pubsub.subscribe(INVALIDATE_CHANNEL, self._on_invalidate)
+        self.pubsub.on_reconnect(self.clear)
+
+    # ─────────────────────────────────────────────
+    # Reads
+    # ─────────────────────────────────────────────
+
+    async def get_all(self, guild_id: int, user_id: int) -> dict[str, str | None]:
+        key = (guild_id, user_id)
+        cached = self._data.get(key)
+        if cached is not None:
+            self._data.move_to_end(key)
+            return cached
+
+        if not getattr(self.bot, "redis", None):
+            return dict.fromkeys(SETTINGS)
+
+        epoch  = self._epoch
+        stored = await self.bot.redis.hgetall(settings_key(guild_id, user_id))
+        if not stored:
+            stored = await self._load_legacy(guild_id, user_id)
+        loaded = {s: stored.get(s) for s in SETTINGS}
+        if epoch == self._epoch:
+            self._store(key, loaded)
+        return loaded
+
+    async def _load_legacy(self, guild_id: int, user_id: int) -> dict[str, str]:
+        """
+        Read-side fallback for users not yet migrated: reads the legacy
+        per-setting keys and folds them into the hash (HSETNX, so a value
+        written through the new layout meanwhile wins).
+        """
+        key  = settings_key(guild_id, user_id)
+        pipe = self.bot.redis.pipeline(transaction=False)
+        for setting in SETTINGS:
+            pipe.get(f"{key}:{setting}")
+        legacy = {s: v for s, v in zip(SETTINGS, await pipe.execute()) if v is not None}
+        if legacy:
+            pipe = self.bot.redis.pipeline(transaction=False)
+            for setting, value in legacy.items():
+                pipe.hsetnx(key, setting, value)
+            await pipe.execute()
+        return legacy
+
+    async def get(self, guild_id: int, user_id: int, setting: str) -> str | None:
+        return (await self.get_all(guild_id, user_id)).get(setting)
+
+    # ─────────────────────────────────────────────
+    # Writes / invalidation
+    # ─────────────────────────────────────────────
+
+    async def set(self, guild_id: int, user_id: int, setting: str, value: str):
+        if not getattr(self.bot, "redis", None):
+            return
+        pipe = self.bot.redis.pipeline(transaction=False)
+        pipe.hset(settings_key(guild_id, user_id), setting, value)
+        pipe.publish(INVALIDATE_CHANNEL, f"{guild_id}:{user_id}")
+        await pipe.execute()
+        self.invalidate(guild_id, user_id)
+
+    def invalidate(self, guild_id: int, user_id: int):
+        self._epoch += 1
+        self._data.pop((guild_id, user_id), None)
+
+    def clear(self):
+        self._epoch += 1
+        self._data.clear()
+
+    def _store(self, key: tuple[int, int], value: dict[str, str | None]):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def broadcast_clear(self):
+        self.clear()
+        await self.pubsub.publish(INVALIDATE_CHANNEL, "*")
+
+    async def _on_invalidate(self, data: str):
+        if data == "*":
+            self.clear()
+            return
+        try:
+            guild_id, user_id = (int(x) for x in data.split(":"))
+        except ValueError:
+            log.warning("⚠️ Malformed settings invalidation: %r", data)
+            return
+        self.invalidate(guild_id, user_id)
+
+
+async def migrate_legacy_settings(redis, batch_size: int = 500) -> int:
+    """
+    Folds legacy reminder:settings:{guild}:{user}:{setting} string keys into
+    the per-user hash. Uses SCAN so Redis stays responsive, and HSETNX so a
+    value written through the new layout always wins. Returns keys migrated.
+    """
+    migrated = 0
+    batch: list[tuple[str, str, str]] = []
+
+    async def _flush():
+        nonlocal migrated
+        if not batch:
+            return
+        pipe = redis.pipeline(transaction=False)
+        for legacy_key, _, _ in batch:
+            pipe.get(legacy_key)
+        values = await pipe.execute()
+
+        pipe = redis.pipeline(transaction=False)
+        for (legacy_key, hash_key, setting), value in zip(batch, values):
+            if value is not None:
+                pipe.hsetnx(hash_key, setting, value)
+            pipe.delete(legacy_key)
+        await pipe.execute()
+        migrated += len(batch)
+        batch.clear()
+
+    async for key in redis.scan_iter(match="reminder:settings:*:*:*", count=batch_size):
+        parts = key.split(":")
+        if len(parts) != 5 or parts[4] not in SETTINGS:
+            continue
+        batch.append((key, ":".join(parts[:4]), parts[4]))
+        if len(batch) >= batch_size:
+            await _flush()
+    await _flush()
+    return migrated
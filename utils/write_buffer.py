@@ -0,0 +1,104 @@
+"""
+utils/write_buffer.py — Write-behind aggregation buffer
+Collects writes in memory keyed by whatever the owner chooses (e.g.
+(redis_key, user_id)), merges repeated keys, and hands the batch to a flush
+callback once it is max_staleness seconds old or holds max_events writes.
+
+Usage:
+    buffer = WriteBuffer(self._flush_counters, name="nai")
+    buffer.add(("lb:nai:all", user_id))      # value defaults to 1, summed on merge
+    await buffer.close()                      # final flush on unload
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import operator
+from typing import Any, Awaitable, Callable, Hashable
+
+from config import WRITE_BUFFER_MAX_EVENTS, WRITE_BUFFER_MAX_STALENESS
+
+log = logging.getLogger("write-buffer")
+
+FlushFn = Callable[[dict[Hashable, Any]], Awaitable[None]]
+
+
+class WriteBuffer:
+    def __init__(
+        self,
+        flush: FlushFn,
+        *,
+        name: str,
+        max_staleness: float = WRITE_BUFFER_MAX_STALENESS,
+        max_events: int = WRITE_BUFFER_MAX_EVENTS,
+        merge: Callable[[Any, Any], Any] = operator.add,
+    ):
+        self._flush_fn     = flush
+        self.name          = name
+        self.max_staleness = max_staleness
+        self.max_events    = max_events
+        self._merge        = merge
+
+        self._pending: dict[Hashable, Any] = {}
+        self._events = 0
+        self._lock   = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, key: Hashable, value: Any = 1):
+        if key in self._pending:
+            self._pending[key] = self._merge(self._pending[key], value)
+        else:
+            self._pending[key] = value
+        self._events += 1
+
+        if self._closed:
+            return
+        if self._events >= self.max_events:
+            if self._inflight:
+                return  # a flush is already queued and will pick this write up
+            self._cancel_timer()
+            task = asyncio.create_task(self.flush())
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def flush(self):
+        async with self._lock:
+            self._cancel_timer()
+            if not self._pending:
+                return
+            batch, self._pending, self._events = self._pending, {}, 0
+            try:
+                await self._flush_fn(batch)
+            except Exception:
+                log.exception("❌ %s buffer flush failed, retrying %s writes later", self.name, len(batch))
+                # Put the batch back in front of anything added meanwhile
+                for key, value in self._pending.items():
+                    batch[key] = self._merge(batch[key], value) if key in batch else value
+                self._pending = batch
+                self._events  = len(batch)
+                if not self._closed and self._timer is None:
+                    self._timer = asyncio.create_task(self._flush_later())
+
+    async def close(self):
+        self._closed = True
+        await self.flush()
+
+    async def _flush_later(self):
+        try:
+            await asyncio.sleep(self.max_staleness)
+        except asyncio.CancelledError:
+            return
+        self._timer = None
+        await self.flush()
+
+    def _cancel_timer(self):
+        if self._timer and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None